@@ -1,7 +1,11 @@
 import asyncio
 import json
+import random
 import time
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 import logging
@@ -10,6 +14,12 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Powers of ten for amount formatting (covers decimals up to 19)
+POW10 = [10 ** i for i in range(20)]
+
+# SPL Token Program
+TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+
 class SolanaWalletMonitor:
     def __init__(self, wallet_address: str, bot_token: str, chat_id: str, rpc_url: str = "https://api.mainnet-beta.solana.com"):
         self.wallet_address = wallet_address
@@ -17,23 +27,44 @@ class SolanaWalletMonitor:
         self.chat_id = chat_id
         self.rpc_url = rpc_url
         self.processed_signatures = set()
-        
+        # Shared session: keep-alive avoids a TCP+TLS handshake per RPC call,
+        # and the adapter retries the 429/5xx responses public RPCs throw
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        self._consecutive_errors = 0
+        # Per-mint memos so the same mint showing up in several transactions
+        # of one poll only hits the network once
+        self._metadata_by_mint: Dict[str, Dict] = {}
+        self._creation_time_by_mint: Dict[str, float] = {}
+        self._last_seen_signature: Optional[str] = None
+
     def get_recent_transactions(self, limit: int = 50) -> List[Dict]:
         """Get recent transactions for the monitored wallet using RPC"""
         try:
+            options = {"limit": limit}
+            if self._last_seen_signature:
+                # Server-side cursor: only return signatures newer than the
+                # last one we processed
+                options["until"] = self._last_seen_signature
             payload = {
                 "jsonrpc": "2.0",
                 "id": 1,
                 "method": "getSignaturesForAddress",
                 "params": [
                     self.wallet_address,
-                    {"limit": limit}
+                    options
                 ]
             }
-            
-            response = requests.post(self.rpc_url, json=payload, timeout=10)
+
+            response = self.session.post(self.rpc_url, data=orjson.dumps(payload),
+                                         headers={"Content-Type": "application/json"}, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if 'result' in data:
                     return data['result']
             return []
@@ -54,9 +85,10 @@ class SolanaWalletMonitor:
                 ]
             }
             
-            response = requests.post(self.rpc_url, json=payload, timeout=10)
+            response = self.session.post(self.rpc_url, data=orjson.dumps(payload),
+                                         headers={"Content-Type": "application/json"}, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if 'result' in data:
                     return data['result']
             return None
@@ -64,88 +96,84 @@ class SolanaWalletMonitor:
             logger.error(f"Error fetching transaction details for {signature}: {e}")
             return None
     
-    def is_new_token_created(self, transaction: Dict) -> bool:
-        """Check if transaction creates a new token account (new launched token)"""
+    def parse_new_token(self, transaction: Dict) -> Optional[Dict]:
+        """Detect a new token account creation and extract its info in one pass"""
+        # Validate the top level once, then use direct subscripts: the happy
+        # path skips the defaulted .get() chains, and any malformed shape
+        # lands in the except below
         try:
-            if not transaction or 'transaction' not in transaction:
-                return False
-                
-            transaction_data = transaction['transaction']
-            message = transaction_data.get('message', {})
-            instructions = message.get('instructions', [])
-            
+            message = transaction['transaction']['message']
+            instructions = message['instructions']
+            account_keys = message['accountKeys']
+            meta = transaction['meta']
+
             # Check for create_token_account instruction
+            created = False
+            n_keys = len(account_keys)
             for instruction in instructions:
-                # Get program ID from accounts
                 program_id_index = instruction.get('programIdIndex', -1)
-                if program_id_index >= 0:
-                    account_keys = message.get('accountKeys', [])
-                    if program_id_index < len(account_keys):
-                        program_id = account_keys[program_id_index]
-                        # Check if it's the Token Program (TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA)
-                        if program_id == "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA":
-                            # Check if this is a create account instruction
-                            data = instruction.get('data', '')
-                            if data and len(data) > 0:
-                                # This is likely a token account creation
-                                return True
-                
-            return False
-        except Exception as e:
-            logger.error(f"Error checking if transaction creates new token: {e}")
-            return False
-    
-    def extract_token_info(self, transaction: Dict) -> Optional[Dict]:
-        """Extract token information from transaction"""
-        try:
-            if not transaction or 'meta' not in transaction:
+                if 0 <= program_id_index < n_keys:
+                    # Instruction data on the Token Program means a likely
+                    # token account creation
+                    if account_keys[program_id_index] == TOKEN_PROGRAM_ID and instruction.get('data'):
+                        created = True
+                        break
+
+            if not created:
                 return None
-                
-            meta = transaction['meta']
-            pre_token_balances = meta.get('preTokenBalances', [])
-            post_token_balances = meta.get('postTokenBalances', [])
-            
+
             # Find new token balances (tokens that weren't there before)
-            new_tokens = []
+            pre_token_balances = meta.get('preTokenBalances') or []
+            post_token_balances = meta.get('postTokenBalances') or []
             existing_mints = {balance['mint'] for balance in pre_token_balances}
-            
+
             for balance in post_token_balances:
                 mint = balance['mint']
                 if mint not in existing_mints:
-                    new_tokens.append({
+                    ui_amount = balance['uiTokenAmount']
+                    return {
                         'mint': mint,
-                        'amount': balance.get('uiTokenAmount', {}).get('amount', '0'),
-                        'decimals': balance.get('uiTokenAmount', {}).get('decimals', 0)
-                    })
-            
-            return new_tokens[0] if new_tokens else None
-            
+                        'amount': ui_amount.get('amount', '0'),
+                        'decimals': ui_amount.get('decimals', 0)
+                    }
+
+            return None
+
+        except (KeyError, TypeError):
+            # Missing transaction/meta or an unexpected shape: not a token
+            # creation we can parse
+            return None
         except Exception as e:
-            logger.error(f"Error extracting token info: {e}")
+            logger.error(f"Error parsing transaction for new token: {e}")
             return None
     
     def get_token_metadata(self, mint_address: str) -> Dict:
         """Get token metadata including name and creation date"""
+        cached = self._metadata_by_mint.get(mint_address)
+        if cached is not None:
+            return cached
         try:
             # Try to get token metadata from Jupiter API
             jupiter_url = f"https://quote-api.jup.ag/v6/tokens/{mint_address}"
-            response = requests.get(jupiter_url, timeout=10)
+            response = self.session.get(jupiter_url, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
-                return {
+                data = orjson.loads(response.content)
+                metadata = {
                     'name': data.get('name', 'Unknown'),
                     'symbol': data.get('symbol', 'Unknown'),
                     'decimals': data.get('decimals', 9)
                 }
-            
+                self._metadata_by_mint[mint_address] = metadata
+                return metadata
+
             # Fallback to basic info
             return {
                 'name': 'Unknown Token',
                 'symbol': 'UNKNOWN',
                 'decimals': 9
             }
-            
+
         except Exception as e:
             logger.error(f"Error fetching token metadata for {mint_address}: {e}")
             return {
@@ -157,37 +185,44 @@ class SolanaWalletMonitor:
     def get_token_age(self, mint_address: str) -> str:
         """Get token age by checking when it was first created"""
         try:
-            # Get the first transaction for this mint address
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getSignaturesForAddress",
-                "params": [
-                    mint_address,
-                    {"limit": 1}
-                ]
-            }
-            
-            response = requests.post(self.rpc_url, json=payload, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if 'result' in data and data['result']:
-                    first_tx = data['result'][0]
-                    first_tx_time = first_tx.get('blockTime', 0)
-                    current_time = time.time()
-                    age_seconds = current_time - first_tx_time
-                    
-                    if age_seconds < 60:
-                        return f"{int(age_seconds)} seconds"
-                    elif age_seconds < 3600:
-                        return f"{int(age_seconds/60)} minutes"
-                    elif age_seconds < 86400:
-                        return f"{int(age_seconds/3600)} hours"
-                    else:
-                        return f"{int(age_seconds/86400)} days"
-            
+            first_tx_time = self._creation_time_by_mint.get(mint_address)
+            if first_tx_time is None:
+                # Get the first transaction for this mint address
+                payload = {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "getSignaturesForAddress",
+                    "params": [
+                        mint_address,
+                        {"limit": 1}
+                    ]
+                }
+
+                response = self.session.post(self.rpc_url, data=orjson.dumps(payload),
+                                             headers={"Content-Type": "application/json"}, timeout=10)
+                if response.status_code == 200:
+                    data = orjson.loads(response.content)
+                    if 'result' in data and data['result']:
+                        first_tx = data['result'][0]
+                        first_tx_time = first_tx.get('blockTime', 0)
+                        # Cache the creation time; the age string is
+                        # recomputed cheaply from it on later calls
+                        self._creation_time_by_mint[mint_address] = first_tx_time
+
+            if first_tx_time is not None:
+                age_seconds = time.time() - first_tx_time
+
+                if age_seconds < 60:
+                    return f"{int(age_seconds)} seconds"
+                elif age_seconds < 3600:
+                    return f"{int(age_seconds/60)} minutes"
+                elif age_seconds < 86400:
+                    return f"{int(age_seconds/3600)} hours"
+                else:
+                    return f"{int(age_seconds/86400)} days"
+
             return "Unknown"
-            
+
         except Exception as e:
             logger.error(f"Error getting token age for {mint_address}: {e}")
             return "Unknown"
@@ -196,9 +231,13 @@ class SolanaWalletMonitor:
         """Format token amount with proper decimal places"""
         try:
             amount_int = int(amount)
-            formatted_amount = amount_int / (10 ** decimals)
-            return f"{formatted_amount:,.6f}".rstrip('0').rstrip('.')
-        except:
+            if decimals <= 0:
+                return f"{amount_int:,}"
+            # Integer divmod keeps full precision for large decimals (float
+            # loses digits above 2**53)
+            q, r = divmod(amount_int, POW10[decimals])
+            return f"{q:,}.{r:0{decimals}d}".rstrip('0').rstrip('.')
+        except (ValueError, IndexError):
             return amount
     
     def create_alert_message(self, token_info: Dict, token_metadata: Dict, token_age: str, signature: str) -> str:
@@ -224,10 +263,13 @@ class SolanaWalletMonitor:
             data = {
                 "chat_id": self.chat_id,
                 "text": message,
-                "parse_mode": "Markdown"
+                "parse_mode": "Markdown",
+                # Skip the solscan.io link preview; Telegram answers faster
+                # when it doesn't have to fetch the page
+                "disable_web_page_preview": True
             }
-            
-            response = requests.post(url, data=data, timeout=10)
+
+            response = self.session.post(url, data=data, timeout=10)
             if response.status_code == 200:
                 logger.info("✅ Telegram notification sent successfully")
                 print("✅ Alert sent to Telegram!")
@@ -251,26 +293,29 @@ class SolanaWalletMonitor:
             try:
                 # Get recent transactions
                 transactions = self.get_recent_transactions(50)
-                
+                if transactions:
+                    self._last_seen_signature = transactions[0]['signature']
+
+                current_time = time.time()
                 for tx in transactions:
                     signature = tx['signature']
-                    
-                    # Skip if already processed
-                    if signature in self.processed_signatures:
-                        continue
-                    
-                    # Check if transaction is recent (within last 10 minutes)
+
+                    # Results are newest-first, so the first stale blockTime
+                    # means everything after it is stale too
                     tx_time = tx.get('blockTime', 0)
-                    current_time = time.time()
                     if current_time - tx_time > 600:  # 10 minutes
+                        break
+
+                    # Skip if already processed
+                    if signature in self.processed_signatures:
                         continue
-                    
+
                     # Get detailed transaction info
                     tx_details = self.get_transaction_details(signature)
                     
-                    if tx_details and self.is_new_token_created(tx_details):
-                        token_info = self.extract_token_info(tx_details)
-                        
+                    if tx_details:
+                        token_info = self.parse_new_token(tx_details)
+
                         if token_info:
                             logger.info(f"New token account created: {token_info['mint']}")
                             print(f"🆕 New launched token detected!")
@@ -290,16 +335,22 @@ class SolanaWalletMonitor:
                     self.processed_signatures.add(signature)
                 
                 # Wait before next check
+                self._consecutive_errors = 0
                 time.sleep(check_interval)
-                
+
             except KeyboardInterrupt:
                 logger.info("Monitoring stopped by user")
                 print("\n🛑 Monitoring stopped by user")
                 break
             except Exception as e:
+                # Jittered exponential backoff so retries don't hammer the
+                # RPC in lockstep during an outage or rate limiting
+                self._consecutive_errors += 1
+                delay = min(60, check_interval * 2 ** (self._consecutive_errors - 1))
+                delay += random.uniform(0, check_interval)
                 logger.error(f"Error in monitoring loop: {e}")
-                print(f"❌ Error: {e}")
-                time.sleep(check_interval)
+                print(f"❌ Error: {e} (retrying in {delay:.0f}s)")
+                time.sleep(delay)
 
 def main():
     """Main function to run the wallet monitor"""
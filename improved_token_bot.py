@@ -1,9 +1,12 @@
 import asyncio
+import sqlite3
 import json
 import time
-import requests
-import base64
-from datetime import datetime, timezone
+import httpx
+import orjson
+import websockets
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from collections import OrderedDict
 from typing import Dict, List, Optional
 import logging
 
@@ -11,172 +14,266 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Picks up the mypyc-compiled extension when it has been built
+from token_scan import SYSTEM_PROGRAM_ID, TOKEN_PROGRAM_ID, scan_instructions
+
+# uvloop roughly doubles event-loop throughput; fall back to the stock loop
+# where it is unavailable (e.g. Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    uvloop = None
+
+# orjson.dumps produces bytes, so requests are sent as a raw body with an
+# explicit content type
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Retry transient transport failures (timeouts, resets) with short
+# exponential backoff; a fresh attempt usually lands on a new connection
+_RETRY_TRANSPORT = dict(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.2, max=2),
+    retry=retry_if_exception_type(httpx.TransportError),
+    reraise=True,
+)
+
+# Powers of ten up to the largest SPL token decimals, computed once
+POW10 = [10 ** i for i in range(20)]
+
 class ImprovedTokenMonitor:
     def __init__(self, wallet_address: str, bot_token: str, chat_id: str, rpc_url: str = "https://api.mainnet-beta.solana.com"):
         self.wallet_address = wallet_address
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.rpc_url = rpc_url
-        self.processed_signatures = set()
-        
-    def get_recent_transactions(self, limit: int = 50) -> List[Dict]:
+        # Bounded FIFO of seen signatures; the 10-minute recency filter means
+        # anything evicted at this size is long out of the live window
+        self.processed_signatures: OrderedDict = OrderedDict()
+        self._max_processed_signatures = 10000
+        # Per-mint caches: metadata entries carry a fetch timestamp and
+        # expire after 300s; creation times are immutable so they never do
+        self._metadata_cache: Dict[str, tuple] = {}
+        self._creation_time_cache: Dict[str, int] = {}
+        # Disk-backed metadata cache: survives restarts, so a bounce of the
+        # bot does not re-fetch every known mint from Jupiter
+        self._db = sqlite3.connect('metadata.db', check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS token_metadata ("
+            "mint TEXT PRIMARY KEY, name TEXT, symbol TEXT, "
+            "decimals INTEGER, fetched_at REAL)"
+        )
+        self._db.commit()
+        self.client: Optional[httpx.AsyncClient] = None
+        # Cursor for getSignaturesForAddress: the server skips everything we
+        # already processed
+        self._last_seen_sig: Optional[str] = None
+        # Push-based monitoring via logsSubscribe; polling stays available
+        # as a fallback when the RPC has no WebSocket endpoint
+        self.use_ws = True
+        # Strong refs to in-flight alert tasks so they are not GC'd mid-send
+        self._pending_tasks: set = set()
+        # Cap concurrent enrichment RPC/API calls to stay within the public
+        # endpoint's rate limit
+        self._enrich_semaphore = asyncio.Semaphore(20)
+
+    def _mark_processed(self, signature: str):
+        """Record a signature, evicting the oldest past the cap"""
+        self.processed_signatures[signature] = None
+        if len(self.processed_signatures) > self._max_processed_signatures:
+            self.processed_signatures.popitem(last=False)
+
+    @retry(**_RETRY_TRANSPORT)
+    async def _post(self, url: str, **kwargs):
+        """POST through the shared client, retrying transport failures"""
+        return await self.client.post(url, **kwargs)
+
+    @retry(**_RETRY_TRANSPORT)
+    async def _get(self, url: str):
+        """GET through the shared client, retrying transport failures"""
+        return await self.client.get(url)
+
+    async def _rpc(self, method: str, params: List) -> Optional[Dict]:
+        """Post a JSON-RPC request to the Solana endpoint"""
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": method,
+            "params": params
+        }
+        response = await self._post(self.rpc_url, content=orjson.dumps(payload),
+                                    headers=_JSON_HEADERS)
+        if response.status_code == 200:
+            return orjson.loads(response.content)
+        return None
+
+    async def get_recent_transactions(self, limit: int = 50) -> List[Dict]:
         """Get recent transactions for the monitored wallet using RPC"""
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getSignaturesForAddress",
-                "params": [
-                    self.wallet_address,
-                    {"limit": limit}
-                ]
-            }
-            
-            response = requests.post(self.rpc_url, json=payload, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if 'result' in data:
-                    return data['result']
+            options = {"limit": limit}
+            if self._last_seen_sig:
+                options["until"] = self._last_seen_sig
+            data = await self._rpc("getSignaturesForAddress", [self.wallet_address, options])
+            if data and 'result' in data:
+                return data['result']
             return []
         except Exception as e:
             logger.error(f"Error fetching transactions: {e}")
             return []
-    
-    def get_transaction_details(self, signature: str) -> Optional[Dict]:
+
+    async def get_transaction_details(self, signature: str) -> Optional[Dict]:
         """Get detailed transaction information using RPC"""
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getTransaction",
-                "params": [
-                    signature,
-                    {"encoding": "json", "maxSupportedTransactionVersion": 0}
-                ]
-            }
-            
-            response = requests.post(self.rpc_url, json=payload, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if 'result' in data:
-                    return data['result']
+            data = await self._rpc("getTransaction", [
+                signature,
+                {"encoding": "json", "maxSupportedTransactionVersion": 0}
+            ])
+            if data and 'result' in data:
+                return data['result']
             return None
         except Exception as e:
             logger.error(f"Error fetching transaction details for {signature}: {e}")
             return None
-    
+
+    async def get_transactions_batch(self, signatures: List[str]) -> List[Optional[Dict]]:
+        """Fetch many transactions in one JSON-RPC batch request.
+
+        Returns results aligned to the input order; entries the server could
+        not resolve are None.
+        """
+        if not signatures:
+            return []
+        try:
+            # JSON-RPC 2.0 batching: one HTTP POST carries an array of
+            # request objects, matched back by id
+            payload = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "getTransaction",
+                    "params": [sig, {"encoding": "json", "maxSupportedTransactionVersion": 0}]
+                }
+                for i, sig in enumerate(signatures)
+            ]
+            response = await self._post(self.rpc_url, content=orjson.dumps(payload),
+                                        headers=_JSON_HEADERS)
+            if response.status_code != 200:
+                return [None] * len(signatures)
+            data = orjson.loads(response.content)
+
+            results: List[Optional[Dict]] = [None] * len(signatures)
+            for item in data:
+                # Responses may arrive reordered; id is the input index
+                idx = item.get('id')
+                if isinstance(idx, int) and 0 <= idx < len(signatures):
+                    results[idx] = item.get('result')
+            return results
+        except Exception as e:
+            logger.error(f"Error fetching transaction batch: {e}")
+            return [None] * len(signatures)
+
     def is_new_token_created(self, transaction: Dict) -> bool:
         """Check if transaction creates a new token account (new launched token)"""
         try:
             if not transaction or 'transaction' not in transaction:
                 return False
-                
+
+            # Failed transactions cannot mint tokens
+            if transaction.get('meta', {}).get('err') is not None:
+                return False
+
             transaction_data = transaction['transaction']
             message = transaction_data.get('message', {})
             instructions = message.get('instructions', [])
             account_keys = message.get('accountKeys', [])
-            
-            print(f"🔍 Analyzing transaction with {len(instructions)} instructions")
-            
-            # Look for token account creation instructions
-            for i, instruction in enumerate(instructions):
-                program_id_index = instruction.get('programIdIndex', -1)
-                if program_id_index >= 0 and program_id_index < len(account_keys):
-                    program_id = account_keys[program_id_index]
-                    
-                    print(f"📋 Instruction {i}: Program ID = {program_id}")
-                    
-                    # Check if it's the Token Program
-                    if program_id == "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA":
-                        print("✅ Found Token Program instruction!")
-                        
-                        # Check instruction data for InitializeAccount (0) or InitializeAccount2 (1)
-                        data = instruction.get('data', '')
-                        if data:
-                            try:
-                                decoded_data = base64.b64decode(data)
-                                if len(decoded_data) > 0:
-                                    instruction_type = decoded_data[0]
-                                    print(f"📊 Instruction type: {instruction_type}")
-                                    # 0 = InitializeAccount, 1 = InitializeAccount2
-                                    if instruction_type in [0, 1]:
-                                        print("🎯 NEW TOKEN ACCOUNT CREATED!")
-                                        return True
-                            except Exception as e:
-                                print(f"❌ Error decoding instruction data: {e}")
-                    
-                    # Also check for System Program (11111111111111111111111111111112) with CreateAccount
-                    elif program_id == "11111111111111111111111111111112":
-                        print("✅ Found System Program instruction!")
-                        data = instruction.get('data', '')
-                        if data:
-                            try:
-                                decoded_data = base64.b64decode(data)
-                                if len(decoded_data) >= 4:
-                                    # System Program CreateAccount instruction type is 0
-                                    instruction_type = int.from_bytes(decoded_data[:4], 'little')
-                                    print(f"📊 System instruction type: {instruction_type}")
-                                    if instruction_type == 0:  # CreateAccount
-                                        print("🎯 NEW ACCOUNT CREATED!")
-                                        return True
-                            except Exception as e:
-                                print(f"❌ Error decoding system instruction data: {e}")
-                
-            return False
+
+            # Creating and initializing a token account references at least
+            # three accounts, and one of them must be a program we care
+            # about — a single pass over the short key list gates the scan
+            if len(account_keys) < 3:
+                return False
+            if not any(k in (TOKEN_PROGRAM_ID, SYSTEM_PROGRAM_ID) for k in account_keys):
+                return False
+
+            logger.debug("Analyzing transaction with %d instructions", len(instructions))
+
+            return scan_instructions(instructions, account_keys)
         except Exception as e:
             logger.error(f"Error checking if transaction creates new token: {e}")
             return False
-    
+
     def extract_new_token_info(self, transaction: Dict) -> Optional[Dict]:
         """Extract new token information from transaction"""
         try:
             if not transaction or 'meta' not in transaction:
                 return None
-                
+
             meta = transaction['meta']
             post_token_balances = meta.get('postTokenBalances', [])
-            
-            print(f"📊 Found {len(post_token_balances)} post token balances")
-            
+
+            logger.debug("Found %d post token balances", len(post_token_balances))
+
             # Find the newest token account created
             if post_token_balances:
                 # Get the first token balance (most likely the new one)
                 balance = post_token_balances[0]
-                print(f"🎯 New token: {balance['mint']}")
+                logger.debug("New token: %s", balance['mint'])
                 return {
                     'mint': balance['mint'],
                     'amount': balance.get('uiTokenAmount', {}).get('amount', '0'),
                     'decimals': balance.get('uiTokenAmount', {}).get('decimals', 0)
                 }
-            
+
             return None
-            
+
         except Exception as e:
             logger.error(f"Error extracting new token info: {e}")
             return None
-    
-    def get_token_metadata(self, mint_address: str) -> Dict:
+
+    async def get_token_metadata(self, mint_address: str) -> Dict:
         """Get token metadata including name and creation date"""
+        cached = self._metadata_cache.get(mint_address)
+        if cached and time.time() - cached[0] < 300:
+            return cached[1]
+
+        # Token name/symbol/decimals never change once set, so a disk hit
+        # is as good as a fresh fetch
+        row = self._db.execute(
+            "SELECT name, symbol, decimals FROM token_metadata WHERE mint = ?",
+            (mint_address,)
+        ).fetchone()
+        if row:
+            metadata = {'name': row[0], 'symbol': row[1], 'decimals': row[2]}
+            self._metadata_cache[mint_address] = (time.time(), metadata)
+            return metadata
+
         try:
             # Try to get token metadata from Jupiter API
             jupiter_url = f"https://quote-api.jup.ag/v6/tokens/{mint_address}"
-            response = requests.get(jupiter_url, timeout=10)
-            
+            response = await self._get(jupiter_url)
             if response.status_code == 200:
-                data = response.json()
-                return {
+                data = orjson.loads(response.content)
+                metadata = {
                     'name': data.get('name', 'Unknown'),
                     'symbol': data.get('symbol', 'Unknown'),
                     'decimals': data.get('decimals', 9)
                 }
-            
+                self._metadata_cache[mint_address] = (time.time(), metadata)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO token_metadata VALUES (?, ?, ?, ?, ?)",
+                    (mint_address, metadata['name'], metadata['symbol'],
+                     metadata['decimals'], time.time())
+                )
+                self._db.commit()
+                return metadata
+
             # Fallback to basic info
             return {
                 'name': 'Unknown Token',
                 'symbol': 'UNKNOWN',
                 'decimals': 9
             }
-            
+
         except Exception as e:
             logger.error(f"Error fetching token metadata for {mint_address}: {e}")
             return {
@@ -184,58 +281,62 @@ class ImprovedTokenMonitor:
                 'symbol': 'UNKNOWN',
                 'decimals': 9
             }
-    
-    def get_token_age(self, mint_address: str) -> str:
+
+    async def get_token_age(self, mint_address: str, known_creation_ts: Optional[int] = None) -> str:
         """Get token age by checking when it was first created"""
         try:
-            # Get the first transaction for this mint address
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getSignaturesForAddress",
-                "params": [
-                    mint_address,
-                    {"limit": 1}
-                ]
-            }
-            
-            response = requests.post(self.rpc_url, json=payload, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if 'result' in data and data['result']:
+            first_tx_time = self._creation_time_cache.get(mint_address)
+            if first_tx_time is None and known_creation_ts:
+                # The detected transaction is the creation transaction, so
+                # its blockTime is the creation time — no extra round-trip
+                first_tx_time = known_creation_ts
+                self._creation_time_cache[mint_address] = first_tx_time
+            if first_tx_time is None:
+                # Get the first transaction for this mint address
+                data = await self._rpc("getSignaturesForAddress", [mint_address, {"limit": 1}])
+                if data and 'result' in data and data['result']:
                     first_tx = data['result'][0]
                     first_tx_time = first_tx.get('blockTime', 0)
-                    current_time = time.time()
-                    age_seconds = current_time - first_tx_time
-                    
-                    if age_seconds < 60:
-                        return f"{int(age_seconds)} seconds"
-                    elif age_seconds < 3600:
-                        return f"{int(age_seconds/60)} minutes"
-                    elif age_seconds < 86400:
-                        return f"{int(age_seconds/3600)} hours"
-                    else:
-                        return f"{int(age_seconds/86400)} days"
-            
+                    # Cache the epoch, not the formatted string: age keeps
+                    # moving but the creation time never does
+                    self._creation_time_cache[mint_address] = first_tx_time
+
+            if first_tx_time is not None:
+                age_seconds = time.time() - first_tx_time
+
+                if age_seconds < 60:
+                    return f"{int(age_seconds)} seconds"
+                elif age_seconds < 3600:
+                    return f"{int(age_seconds/60)} minutes"
+                elif age_seconds < 86400:
+                    return f"{int(age_seconds/3600)} hours"
+                else:
+                    return f"{int(age_seconds/86400)} days"
+
             return "Unknown"
-            
+
         except Exception as e:
             logger.error(f"Error getting token age for {mint_address}: {e}")
             return "Unknown"
-    
+
     def format_amount(self, amount: str, decimals: int) -> str:
         """Format token amount with proper decimal places"""
         try:
+            # Integer divmod against a precomputed power of ten: no float
+            # rounding and no 10**decimals per call
             amount_int = int(amount)
-            formatted_amount = amount_int / (10 ** decimals)
-            return f"{formatted_amount:,.6f}".rstrip('0').rstrip('.')
-        except:
+            q, r = divmod(amount_int, POW10[decimals])
+            return f"{q:,}.{r:0{decimals}d}".rstrip('0').rstrip('.')
+        except Exception:
             return amount
-    
+
     def create_alert_message(self, token_info: Dict, token_metadata: Dict, token_age: str, signature: str) -> str:
         """Create formatted alert message"""
         amount = self.format_amount(token_info['amount'], token_info['decimals'])
-        
+        # Plain f-string over gmtime fields: skips strftime's locale lookup
+        # and format-string parse
+        t = time.gmtime()
+
         message = f"""🚨 *NEW LAUNCHED TOKEN DETECTED!* 🚨
 
 ✅ *Token Name:* {token_metadata['name']} ({token_metadata['symbol']})
@@ -245,10 +346,10 @@ class ImprovedTokenMonitor:
 ✅ *TX Link:* https://solscan.io/tx/{signature}
 
 *Wallet:* `{self.wallet_address}`
-*Time:* {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"""
+*Time:* {t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d} UTC"""
         return message.strip()
-    
-    def send_telegram_alert(self, message: str):
+
+    async def send_telegram_alert(self, message: str):
         """Send alert to Telegram"""
         try:
             url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
@@ -257,83 +358,154 @@ class ImprovedTokenMonitor:
                 "text": message,
                 "parse_mode": "Markdown"
             }
-            
-            response = requests.post(url, data=data, timeout=10)
+
+            response = await self._post(url, data=data)
             if response.status_code == 200:
                 logger.info("✅ Telegram notification sent successfully")
                 print("✅ Alert sent to Telegram!")
             else:
                 logger.error(f"❌ Failed to send Telegram notification: {response.status_code}")
                 print(f"❌ Failed to send to Telegram: {response.status_code}")
-                
+
         except Exception as e:
             logger.error(f"❌ Error sending Telegram notification: {e}")
             print(f"❌ Error: {e}")
-    
-    def monitor_wallet(self, check_interval: int = 30):
+
+    async def _enrich_and_alert(self, signature: str, token_info: Dict, block_time: Optional[int]):
+        """Fetch metadata and age for a detected token, then alert"""
+        async with self._enrich_semaphore:
+            # Metadata and age hit different endpoints; run them together
+            token_metadata, token_age = await asyncio.gather(
+                self.get_token_metadata(token_info['mint']),
+                self.get_token_age(token_info['mint'], block_time)
+            )
+
+        alert_message = self.create_alert_message(
+            token_info, token_metadata, token_age, signature
+        )
+        await self.send_telegram_alert(alert_message)
+
+    def _process_transaction(self, signature: str, tx_details: Optional[Dict]):
+        """Inspect one fetched transaction and alert if it launched a new token"""
+        if tx_details and self.is_new_token_created(tx_details):
+            token_info = self.extract_new_token_info(tx_details)
+
+            if token_info:
+                logger.info(f"New token account created: {token_info['mint']}")
+                print(f"🆕 NEW LAUNCHED TOKEN DETECTED!")
+
+                # Enrichment and alerting run as background tasks so the
+                # scan of the current batch — and the next polling cycle —
+                # never waits on metadata round-trips
+                task = asyncio.create_task(self._enrich_and_alert(
+                    signature, token_info, tx_details.get('blockTime')
+                ))
+                self._pending_tasks.add(task)
+                task.add_done_callback(self._pending_tasks.discard)
+
+    async def _monitor_via_websocket(self):
+        """Push-based monitoring: logsSubscribe delivers new signatures the
+        moment they land instead of re-polling getSignaturesForAddress."""
+        ws_url = self.rpc_url.replace("https://", "wss://", 1)
+        subscribe = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "logsSubscribe",
+            "params": [
+                {"mentions": [self.wallet_address]},
+                {"commitment": "confirmed"}
+            ]
+        }
+
+        async for ws in websockets.connect(ws_url):
+            try:
+                await ws.send(orjson.dumps(subscribe).decode())
+                logger.info("Subscribed to logs for %s", self.wallet_address)
+
+                async for raw in ws:
+                    msg = orjson.loads(raw)
+                    value = (msg.get('params', {}).get('result', {}) or {}).get('value', {})
+                    signature = value.get('signature')
+                    if not signature or signature in self.processed_signatures:
+                        continue
+                    self._mark_processed(signature)
+
+                    tx_details = await self.get_transaction_details(signature)
+                    self._process_transaction(signature, tx_details)
+            except websockets.ConnectionClosed:
+                logger.warning("WebSocket connection closed, reconnecting...")
+                continue
+
+    async def monitor_wallet(self, check_interval: int = 30):
         """Main monitoring loop"""
         logger.info(f"Starting new token monitoring for: {self.wallet_address}")
         logger.info(f"Check interval: {check_interval} seconds")
         print(f"🔍 Monitoring wallet for NEW LAUNCHED TOKENS: {self.wallet_address}")
         print(f"⏰ Check interval: {check_interval} seconds")
         print("Press Ctrl+C to stop...")
-        
-        while True:
-            try:
-                # Get recent transactions
-                transactions = self.get_recent_transactions(50)
-                print(f"📊 Found {len(transactions)} recent transactions")
-                
-                for tx in transactions:
-                    signature = tx['signature']
-                    
-                    # Skip if already processed
-                    if signature in self.processed_signatures:
-                        continue
-                    
-                    # Check if transaction is recent (within last 10 minutes)
-                    tx_time = tx.get('blockTime', 0)
+
+        # One client for the whole process. HTTP/2 multiplexes the burst of
+        # concurrent RPC calls over a single TLS connection instead of
+        # opening one socket per request; keepalive_expiry must outlive the
+        # poll interval so cycles reuse the same connection
+        limits = httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=75.0
+        )
+        # Fail slow endpoints fast: 2s to connect, 5s to read, and let the
+        # retry wrapper take another attempt on a fresh connection
+        timeout = httpx.Timeout(connect=2.0, read=5.0, write=5.0, pool=5.0)
+        async with httpx.AsyncClient(http2=True, timeout=timeout, limits=limits) as client:
+            self.client = client
+
+            if self.use_ws:
+                try:
+                    await self._monitor_via_websocket()
+                    return
+                except Exception as e:
+                    logger.error(f"WebSocket monitoring failed ({e}), falling back to polling")
+
+            while True:
+                try:
+                    # Get recent transactions
+                    transactions = await self.get_recent_transactions(50)
+                    logger.debug("Found %d recent transactions", len(transactions))
+                    if transactions:
+                        self._last_seen_sig = transactions[0]['signature']
+
+                    new_signatures = []
                     current_time = time.time()
-                    if current_time - tx_time > 600:  # 10 minutes
-                        continue
-                    
-                    print(f"🔍 Checking transaction: {signature[:8]}...")
-                    
-                    # Get detailed transaction info
-                    tx_details = self.get_transaction_details(signature)
-                    
-                    if tx_details and self.is_new_token_created(tx_details):
-                        token_info = self.extract_new_token_info(tx_details)
-                        
-                        if token_info:
-                            logger.info(f"New token account created: {token_info['mint']}")
-                            print(f"🆕 NEW LAUNCHED TOKEN DETECTED!")
-                            
-                            # Get token metadata and age
-                            token_metadata = self.get_token_metadata(token_info['mint'])
-                            token_age = self.get_token_age(token_info['mint'])
-                            
-                            # Create and send alert
-                            alert_message = self.create_alert_message(
-                                token_info, token_metadata, token_age, signature
-                            )
-                            
-                            self.send_telegram_alert(alert_message)
-                    
-                    # Mark as processed
-                    self.processed_signatures.add(signature)
-                
-                # Wait before next check
-                time.sleep(check_interval)
-                
-            except KeyboardInterrupt:
-                logger.info("Monitoring stopped by user")
-                print("\n🛑 Monitoring stopped by user")
-                break
-            except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}")
-                print(f"❌ Error: {e}")
-                time.sleep(check_interval)
+                    for tx in transactions:
+                        signature = tx['signature']
+
+                        # The until cursor already excludes processed
+                        # signatures server-side; only the recency window
+                        # needs checking here (within last 10 minutes)
+                        tx_time = tx.get('blockTime', 0)
+                        if current_time - tx_time > 600:  # 10 minutes
+                            continue
+
+                        new_signatures.append(signature)
+                        self._mark_processed(signature)
+
+                    if new_signatures:
+                        logger.debug("Checking %d new transactions", len(new_signatures))
+                        # One batched POST for all details, then process the
+                        # hits concurrently
+                        details = await self.get_transactions_batch(new_signatures)
+                        for sig, tx in zip(new_signatures, details):
+                            self._process_transaction(sig, tx)
+
+                    # Wait before next check
+                    await asyncio.sleep(check_interval)
+
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error in monitoring loop: {e}")
+                    print(f"❌ Error: {e}")
+                    await asyncio.sleep(check_interval)
 
 def main():
     """Main function to run the wallet monitor"""
@@ -343,19 +515,22 @@ def main():
     TELEGRAM_CHAT_ID = "6251161332"
     RPC_URL = "https://api.mainnet-beta.solana.com"
     CHECK_INTERVAL = 30  # Check every 30 seconds
-    
+
     # Validate wallet address
     if len(WALLET_ADDRESS) < 32:
         print(f"❌ Invalid wallet address format. Expected at least 32 characters, got {len(WALLET_ADDRESS)}")
         return
-    
+
     print(f"✅ Wallet address is valid: {WALLET_ADDRESS}")
-    
+
     # Create and start monitor
     monitor = ImprovedTokenMonitor(WALLET_ADDRESS, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, RPC_URL)
-    
+
     try:
-        monitor.monitor_wallet(CHECK_INTERVAL)
+        asyncio.run(monitor.monitor_wallet(CHECK_INTERVAL))
+    except KeyboardInterrupt:
+        logger.info("Monitoring stopped by user")
+        print("\n🛑 Monitoring stopped by user")
     except Exception as e:
         print(f"❌ Error: {e}")
 
@@ -364,6 +539,6 @@ if __name__ == "__main__":
     print("=" * 60)
     print("Monitoring for NEW LAUNCHED TOKENS with detailed analysis!")
     print("=" * 60)
-    
+
     # Run the bot
     main()
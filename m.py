@@ -1,6 +1,12 @@
+import aiohttp
 import asyncio
-import requests
+import base58
+import orjson
+import cachetools
+import sys
+from collections import OrderedDict
 import time
+import websockets
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 import logging
@@ -9,151 +15,252 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# uvloop swaps the selector event loop for libuv's C implementation —
+# fewer syscalls per request at high polling rates; fall back to the stock
+# loop where it is unavailable (e.g. Windows)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
+# Interned at module scope: membership is O(1) and the program-id equality
+# checks compare pointers, not characters
+SPL_TOKEN_PROGRAM = sys.intern("spl-token")
+SPL_ATA_PROGRAM = sys.intern("spl-associated-token-account")
+SPL_TOKEN_CREATE_TYPES = frozenset({
+    "createAccount",
+    "createTokenAccount",
+    "initializeAccount",
+    "initializeAccount3"
+})
+SPL_ATA_CREATE_TYPES = frozenset({"create", "createIdempotent"})
+
+# orjson emits bytes, so the content type must be set by hand
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Log-line markers emitted by the SPL Token / ATA programs for the
+# instructions we alert on; anything else can be dropped without fetching
+# the full transaction
+_CREATE_LOG_MARKERS = ("Instruction: Initialize", "Instruction: Create")
+
 class SolanaWalletMonitor:
     def __init__(self, wallet_address: str, bot_token: str, chat_id: str, rpc_url: str = "https://api.mainnet-beta.solana.com"):
         self.wallet_address = wallet_address
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.rpc_url = rpc_url
-        self.processed_signatures = set()
-        
-    def get_recent_transactions(self, limit: int = 50) -> List[Dict]:
+        # Insertion-ordered so the oldest signatures can be evicted once the
+        # cap is hit; the 5-minute recency window means nothing old is ever
+        # looked up again
+        self.processed_signatures = OrderedDict()
+        # Metadata is effectively immutable (1h TTL); age moves, so only
+        # briefly reusable (60s TTL) — both save an HTTPS round-trip per hit
+        self._meta_cache = cachetools.TTLCache(maxsize=1024, ttl=3600)
+        self._age_cache = cachetools.TTLCache(maxsize=1024, ttl=60)
+        # One pooled aiohttp session for RPC, Jupiter and Telegram: keep-alive
+        # skips the TCP+TLS handshake on every call, and concurrent requests
+        # share the connector instead of one thread each
+        self.session: Optional[aiohttp.ClientSession] = None
+        # Push-based monitoring via logsSubscribe; polling stays available
+        # as a fallback when the RPC has no WebSocket endpoint
+        self.use_ws = True
+        # Adaptive polling cadence: quick after a hit, lazy when idle
+        self._backoff = 1.0
+        # Cursor for getSignaturesForAddress: the server skips everything we
+        # already processed
+        self._last_seen_sig: Optional[str] = None
+        # Request templates built once and mutated in place per call — the
+        # constant parts are never reallocated or re-hashed
+        self._sig_payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "getSignaturesForAddress",
+            "params": [self.wallet_address, {"limit": 50}]
+        }
+        self._tx_payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "getTransaction",
+            "params": [
+                None,
+                {
+                    "encoding": "jsonParsed",
+                    "maxSupportedTransactionVersion": 0,
+                    "commitment": "confirmed"
+                }
+            ]
+        }
+        self._age_payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "getSignaturesForAddress",
+            "params": [None, {"limit": 1000}]
+        }
+        # Alert template compiled once with the wallet baked in; per-alert
+        # work is a single format_map over the dynamic fields
+        self._alert_template = (
+            "🚨 *NEW TOKEN LAUNCH DETECTED!* 🚨\n"
+            "\n"
+            "✅ *Token Name:* {name} ({symbol})\n"
+            "✅ *Mint Address:* `{mint}`\n"
+            "✅ *Amount:* {amount} {symbol}\n"
+            "✅ *Token Age:* {age}\n"
+            "✅ *TX Link:* https://solscan.io/tx/{sig}\n"
+            "\n"
+            "*Wallet:* `" + wallet_address + "`\n"
+            "*Time:* {time}"
+        )
+
+    @staticmethod
+    def _sig_key(signature: str) -> bytes:
+        """Decode a base58 signature to its 64 raw bytes for set storage"""
+        try:
+            return base58.b58decode(signature)
+        except ValueError:
+            # Malformed input: fall back to the encoded form
+            return signature.encode()
+
+    def _mark_processed(self, signature: str):
+        """Record a signature, evicting the oldest past the cap"""
+        self.processed_signatures[self._sig_key(signature)] = None
+        if len(self.processed_signatures) > 20000:
+            self.processed_signatures.popitem(last=False)
+
+    async def get_recent_transactions(self, limit: int = 50) -> List[Dict]:
         """Get recent transactions for the monitored wallet using RPC"""
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getSignaturesForAddress",
-                "params": [
-                    self.wallet_address,
-                    {"limit": limit}
-                ]
-            }
-            
-            response = requests.post(self.rpc_url, json=payload, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if 'result' in data:
-                    return data['result']
+            options = self._sig_payload['params'][1]
+            options['limit'] = limit
+            if self._last_seen_sig:
+                options['until'] = self._last_seen_sig
+            else:
+                options.pop('until', None)
+            payload = self._sig_payload
+
+            async with self.session.post(self.rpc_url, data=orjson.dumps(payload),
+                                         headers=_JSON_HEADERS) as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    if 'result' in data:
+                        return data['result']
             return []
         except Exception as e:
             logger.error(f"Error fetching transactions: {e}")
             return []
-    
-    def get_transaction_details(self, signature: str) -> Optional[Dict]:
+
+    async def get_transaction_details(self, signature: str) -> Optional[Dict]:
         """Get detailed transaction information using RPC with jsonParsed encoding"""
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getTransaction",
-                "params": [
-                    signature,
-                    {
-                        "encoding": "jsonParsed",
-                        "maxSupportedTransactionVersion": 0,
-                        "commitment": "confirmed"
-                    }
-                ]
-            }
-            
-            response = requests.post(self.rpc_url, json=payload, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if 'result' in data:
-                    return data['result']
+            self._tx_payload['params'][0] = signature
+            payload = self._tx_payload
+
+            async with self.session.post(self.rpc_url, data=orjson.dumps(payload),
+                                         headers=_JSON_HEADERS) as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    if 'result' in data:
+                        return data['result']
             return None
         except Exception as e:
             logger.error(f"Error fetching transaction details for {signature}: {e}")
             return None
-    
+
+    async def get_transactions_batch(self, signatures: List[str]) -> Dict[str, Optional[Dict]]:
+        """Fetch many transactions in one JSON-RPC batch request.
+
+        Returns a dict keyed by signature; entries the server could not
+        resolve are None.
+        """
+        if not signatures:
+            return {}
+        try:
+            # JSON-RPC 2.0 batching: one HTTP POST carries an array of
+            # request objects, matched back by id
+            payload = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "getTransaction",
+                    "params": [
+                        sig,
+                        {
+                            "encoding": "jsonParsed",
+                            "maxSupportedTransactionVersion": 0,
+                            "commitment": "confirmed"
+                        }
+                    ]
+                }
+                for i, sig in enumerate(signatures)
+            ]
+
+            async with self.session.post(self.rpc_url, data=orjson.dumps(payload),
+                                         headers=_JSON_HEADERS) as response:
+                if response.status != 200:
+                    # Some public RPCs reject batch arrays; fall back to a
+                    # concurrent per-signature fan-out
+                    return await self._get_transactions_concurrent(signatures)
+                data = orjson.loads(await response.read())
+
+            results: Dict[str, Optional[Dict]] = {sig: None for sig in signatures}
+            for item in data:
+                # Responses may arrive reordered; id is the input index
+                idx = item.get('id')
+                if isinstance(idx, int) and 0 <= idx < len(signatures):
+                    results[signatures[idx]] = item.get('result')
+            return results
+        except Exception as e:
+            logger.error(f"Error fetching transaction batch: {e}")
+            return await self._get_transactions_concurrent(signatures)
+
+    async def _get_transactions_concurrent(self, signatures: List[str]) -> Dict[str, Optional[Dict]]:
+        """Fetch transactions concurrently when the RPC rejects batches"""
+        details = await asyncio.gather(
+            *(self.get_transaction_details(sig) for sig in signatures)
+        )
+        return dict(zip(signatures, details))
+
+    @staticmethod
+    def _iter_instructions(transaction: Dict):
+        """Yield main instructions, then every inner instruction"""
+        message = transaction.get('transaction', {}).get('message', {})
+        yield from message.get('instructions', [])
+        for inner_group in transaction.get('meta', {}).get('innerInstructions', []):
+            yield from inner_group.get('instructions', [])
+
     def is_new_token_created(self, transaction: Dict) -> bool:
         """Check if transaction creates a new token account - ANY match will trigger alert"""
         try:
             if not transaction or 'transaction' not in transaction:
                 return False
-                
-            transaction_data = transaction['transaction']
-            message = transaction_data.get('message', {})
-            instructions = message.get('instructions', [])
-            
-            print(f"🔍 Analyzing transaction with {len(instructions)} instructions")
-            
-            # Check main instructions for token account creation
-            for i, instruction in enumerate(instructions):
-                program_id = instruction.get('program', '')
-                parsed = instruction.get('parsed', {})
-                instruction_type = parsed.get('type', '')
-                
-                print(f"📋 Instruction {i}: Program = {program_id}, Type = {instruction_type}")
-                
-                # ANY of these instructions will trigger alert
-                if program_id == "spl-token" and instruction_type in [
-                    "createAccount", 
-                    "createTokenAccount",
-                    "initializeAccount",
-                    "initializeAccount3"
-                ]:
-                    print(f"✅ Found token account creation: {instruction_type}")
-                    return True
-                
-                if program_id == "spl-associated-token-account" and instruction_type in [
-                    "create",
-                    "createIdempotent"
-                ]:
-                    print(f"✅ Found associated token account creation: {instruction_type}")
-                    return True
-            
-            # Check inner instructions
-            meta = transaction.get('meta', {})
-            inner_instructions = meta.get('innerInstructions', [])
-            
-            print(f"📋 Checking {len(inner_instructions)} inner instruction groups")
-            
-            for inner_group in inner_instructions:
-                for inner_instruction in inner_group.get('instructions', []):
-                    program_id = inner_instruction.get('program', '')
-                    parsed = inner_instruction.get('parsed', {})
-                    instruction_type = parsed.get('type', '')
-                    
-                    print(f"📋 Inner Instruction: Program = {program_id}, Type = {instruction_type}")
-                    
-                    # ANY of these instructions will trigger alert
-                    if program_id == "spl-token" and instruction_type in [
-                        "createAccount", 
-                        "createTokenAccount",
-                        "initializeAccount",
-                        "initializeAccount3"
-                    ]:
-                        print(f"✅ Found inner token account creation: {instruction_type}")
-                        return True
-                    
-                    if program_id == "spl-associated-token-account" and instruction_type in [
-                        "create",
-                        "createIdempotent"
-                    ]:
-                        print(f"✅ Found inner associated token account creation: {instruction_type}")
-                        return True
-            
-            return False
+
+            # One generator covers main and inner instructions with the same
+            # membership test; any() stops at the first match
+            return any(
+                (instruction.get('program') == SPL_TOKEN_PROGRAM
+                 and instruction.get('parsed', {}).get('type') in SPL_TOKEN_CREATE_TYPES)
+                or (instruction.get('program') == SPL_ATA_PROGRAM
+                    and instruction.get('parsed', {}).get('type') in SPL_ATA_CREATE_TYPES)
+                for instruction in self._iter_instructions(transaction)
+            )
         except Exception as e:
             logger.error(f"Error checking if transaction creates new token: {e}")
             return False
-    
+
     def extract_new_token_info(self, transaction: Dict) -> Optional[Dict]:
         """Extract new token information from transaction"""
         try:
             if not transaction or 'meta' not in transaction:
                 return None
-                
+
             meta = transaction['meta']
             post_token_balances = meta.get('postTokenBalances', [])
-            
+
             # Find first token with positive balance
             for balance in post_token_balances:
                 mint = balance['mint']
                 ui_amount = balance.get('uiTokenAmount', {}).get('uiAmount', 0)
-                
+
                 if ui_amount is not None and ui_amount > 0:
                     return {
                         'mint': mint,
@@ -161,33 +268,37 @@ class SolanaWalletMonitor:
                         'decimals': balance.get('uiTokenAmount', {}).get('decimals', 0),
                         'ui_amount': ui_amount
                     }
-            
+
             return None
-            
+
         except Exception as e:
             logger.error(f"Error extracting new token info: {e}")
             return None
-    
-    def get_token_metadata(self, mint_address: str) -> Dict:
+
+    async def get_token_metadata(self, mint_address: str) -> Dict:
         """Get token metadata from Jupiter API"""
+        cached = self._meta_cache.get(mint_address)
+        if cached is not None:
+            return cached
         try:
             url = f"https://quote-api.jup.ag/v6/tokens/{mint_address}"
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    'name': data.get('name', 'Unknown'),
-                    'symbol': data.get('symbol', 'Unknown'),
-                    'decimals': data.get('decimals', 9)
-                }
-            
+            async with self.session.get(url) as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    metadata = {
+                        'name': data.get('name', 'Unknown'),
+                        'symbol': data.get('symbol', 'Unknown'),
+                        'decimals': data.get('decimals', 9)
+                    }
+                    self._meta_cache[mint_address] = metadata
+                    return metadata
+
             return {
                 'name': 'Unknown Token',
                 'symbol': 'UNKNOWN',
                 'decimals': 9
             }
-            
+
         except Exception as e:
             logger.error(f"Error fetching token metadata for {mint_address}: {e}")
             return {
@@ -195,44 +306,43 @@ class SolanaWalletMonitor:
                 'symbol': 'UNKNOWN',
                 'decimals': 9
             }
-    
-    def get_token_age(self, mint_address: str) -> str:
+
+    async def get_token_age(self, mint_address: str) -> str:
         """Get token age by checking when it was first created"""
+        cached = self._age_cache.get(mint_address)
+        if cached is not None:
+            return cached
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getSignaturesForAddress",
-                "params": [
-                    mint_address,
-                    {"limit": 1000}
-                ]
-            }
-            
-            response = requests.post(self.rpc_url, json=payload, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if 'result' in data and data['result']:
-                    oldest_tx = data['result'][-1]
-                    first_tx_time = oldest_tx.get('blockTime', 0)
-                    current_time = time.time()
-                    age_seconds = current_time - first_tx_time
-                    
-                    if age_seconds < 60:
-                        return f"{int(age_seconds)} seconds"
-                    elif age_seconds < 3600:
-                        return f"{int(age_seconds/60)} minutes"
-                    elif age_seconds < 86400:
-                        return f"{int(age_seconds/3600)} hours"
-                    else:
-                        return f"{int(age_seconds/86400)} days"
-            
+            self._age_payload['params'][0] = mint_address
+            payload = self._age_payload
+
+            async with self.session.post(self.rpc_url, data=orjson.dumps(payload),
+                                         headers=_JSON_HEADERS) as response:
+                if response.status == 200:
+                    data = orjson.loads(await response.read())
+                    if 'result' in data and data['result']:
+                        oldest_tx = data['result'][-1]
+                        first_tx_time = oldest_tx.get('blockTime', 0)
+                        current_time = time.time()
+                        age_seconds = current_time - first_tx_time
+
+                        if age_seconds < 60:
+                            age = f"{int(age_seconds)} seconds"
+                        elif age_seconds < 3600:
+                            age = f"{int(age_seconds/60)} minutes"
+                        elif age_seconds < 86400:
+                            age = f"{int(age_seconds/3600)} hours"
+                        else:
+                            age = f"{int(age_seconds/86400)} days"
+                        self._age_cache[mint_address] = age
+                        return age
+
             return "Unknown"
-            
+
         except Exception as e:
             logger.error(f"Error getting token age for {mint_address}: {e}")
             return "Unknown"
-    
+
     def format_amount(self, amount: str, decimals: int) -> str:
         """Format token amount with proper decimal places"""
         try:
@@ -241,24 +351,21 @@ class SolanaWalletMonitor:
             return f"{formatted_amount:,.6f}".rstrip('0').rstrip('.')
         except:
             return amount
-    
+
     def create_alert_message(self, token_info: Dict, token_metadata: Dict, token_age: str, signature: str) -> str:
         """Create formatted alert message"""
-        amount = self.format_amount(token_info['amount'], token_info['decimals'])
-        
-        message = f"""🚨 *NEW TOKEN LAUNCH DETECTED!* 🚨
-
-✅ *Token Name:* {token_metadata['name']} ({token_metadata['symbol']})
-✅ *Mint Address:* `{token_info['mint']}`
-✅ *Amount:* {amount} {token_metadata['symbol']}
-✅ *Token Age:* {token_age}
-✅ *TX Link:* https://solscan.io/tx/{signature}
-
-*Wallet:* `{self.wallet_address}`
-*Time:* {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"""
-        return message.strip()
-    
-    def send_telegram_alert(self, message: str):
+        return self._alert_template.format_map({
+            'name': token_metadata['name'],
+            'symbol': token_metadata['symbol'],
+            'mint': token_info['mint'],
+            'amount': self.format_amount(token_info['amount'], token_info['decimals']),
+            'age': token_age,
+            'sig': signature,
+            # isoformat skips strftime's locale machinery
+            'time': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        })
+
+    async def send_telegram_alert(self, message: str):
         """Send alert to Telegram"""
         try:
             url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
@@ -267,93 +374,182 @@ class SolanaWalletMonitor:
                 "text": message,
                 "parse_mode": "Markdown"
             }
-            
-            response = requests.post(url, data=data, timeout=10)
-            if response.status_code == 200:
-                logger.info("✅ Telegram notification sent successfully")
-                print("✅ Alert sent to Telegram!")
-            else:
-                logger.error(f"❌ Failed to send Telegram notification: {response.status_code}")
-                print(f"❌ Failed to send to Telegram: {response.status_code}")
-                
+
+            async with self.session.post(url, data=data) as response:
+                if response.status == 200:
+                    logger.info("✅ Telegram notification sent successfully")
+                    print("✅ Alert sent to Telegram!")
+                else:
+                    logger.error(f"❌ Failed to send Telegram notification: {response.status}")
+                    print(f"❌ Failed to send to Telegram: {response.status}")
+
         except Exception as e:
             logger.error(f"❌ Error sending Telegram notification: {e}")
             print(f"❌ Error: {e}")
-    
-    def monitor_wallet(self, check_interval: int = 10):
-        """Main monitoring loop - optimized to catch ALL new token purchases"""
-        logger.info(f"Starting wallet monitoring for: {self.wallet_address}")
-        logger.info(f"Check interval: {check_interval} seconds")
-        print(f"🔍 Monitoring wallet: {self.wallet_address}")
-        print(f"⏰ Check interval: {check_interval} seconds")
-        print("🎯 Catching ALL new token purchases - no misses!")
-        print("Press Ctrl+C to stop...")
-        
-        while True:
+
+    async def _monitor_via_websocket(self):
+        """Push-based monitoring: logsSubscribe delivers new signatures the
+        moment they land instead of re-polling getSignaturesForAddress."""
+        ws_url = self.rpc_url.replace("https://", "wss://", 1)
+        subscribe = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "logsSubscribe",
+            "params": [
+                {"mentions": [self.wallet_address]},
+                {"commitment": "confirmed"}
+            ]
+        }
+
+        # websockets reconnects transparently when iterated this way
+        async for ws in websockets.connect(ws_url, ping_interval=20):
             try:
-                # Get recent transactions (increased limit)
-                transactions = self.get_recent_transactions(100)
-                print(f"📊 Found {len(transactions)} recent transactions")
-                
-                new_token_count = 0
-                
-                for tx in transactions:
-                    signature = tx['signature']
-                    
-                    # Skip if already processed
-                    if signature in self.processed_signatures:
+                # decode so the subscribe goes out as a text frame
+                await ws.send(orjson.dumps(subscribe).decode())
+                logger.info("Subscribed to logs for %s", self.wallet_address)
+
+                async for raw in ws:
+                    msg = orjson.loads(raw)
+                    result = msg.get('params', {}).get('result', {})
+                    value = result.get('value', {})
+                    signature = value.get('signature')
+                    if not signature or self._sig_key(signature) in self.processed_signatures:
                         continue
-                    
-                    # Check if transaction is recent (within last 5 minutes)
-                    tx_time = tx.get('blockTime', 0)
-                    current_time = time.time()
-                    if current_time - tx_time > 300:  # 5 minutes
-                        print(f"⏰ Skipping old transaction: {signature[:8]}... (age: {int(current_time - tx_time)}s)")
+                    self._mark_processed(signature)
+
+                    # The subscription payload already carries the program
+                    # logs; skip the full-transaction fetch unless some log
+                    # line mentions an initialize/create instruction
+                    logs = value.get('logs') or []
+                    if not any(marker in line for line in logs
+                               for marker in _CREATE_LOG_MARKERS):
                         continue
-                    
-                    print(f"🔍 Checking transaction: {signature[:8]}...")
-                    
-                    # Get detailed transaction info
-                    tx_details = self.get_transaction_details(signature)
-                    
+
+                    tx_details = await self.get_transaction_details(signature)
                     if tx_details and self.is_new_token_created(tx_details):
                         token_info = self.extract_new_token_info(tx_details)
-                        
                         if token_info:
-                            new_token_count += 1
                             logger.info(f"New token launch detected: {token_info['mint']}")
-                            print(f"🆕 NEW TOKEN LAUNCH DETECTED! (#{new_token_count})")
-                            
-                            # Get token metadata and age
-                            token_metadata = self.get_token_metadata(token_info['mint'])
-                            token_age = self.get_token_age(token_info['mint'])
-                            
-                            # Create and send alert
+                            print(f"🆕 NEW TOKEN LAUNCH DETECTED!")
+
+                            token_metadata, token_age = await asyncio.gather(
+                                self.get_token_metadata(token_info['mint']),
+                                self.get_token_age(token_info['mint'])
+                            )
                             alert_message = self.create_alert_message(
                                 token_info, token_metadata, token_age, signature
                             )
-                            
-                            self.send_telegram_alert(alert_message)
-                    
-                    # Mark as processed
-                    self.processed_signatures.add(signature)
-                
-                if new_token_count > 0:
-                    print(f"🎉 Found {new_token_count} new token purchases in this check!")
-                else:
-                    print("📭 No new token purchases found in this check")
-                
-                # Wait before next check
-                time.sleep(check_interval)
-                
-            except KeyboardInterrupt:
-                logger.info("Monitoring stopped by user")
-                print("\n🛑 Monitoring stopped by user")
-                break
-            except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}")
-                print(f"❌ Error: {e}")
-                time.sleep(check_interval)
+                            await self.send_telegram_alert(alert_message)
+            except websockets.ConnectionClosed:
+                logger.warning("WebSocket connection closed, reconnecting...")
+                continue
+
+    async def monitor_wallet(self, check_interval: int = 10):
+        """Main monitoring loop - optimized to catch ALL new token purchases"""
+        logger.info(f"Starting wallet monitoring for: {self.wallet_address}")
+        logger.info(f"Check interval: {check_interval} seconds")
+        print(f"🔍 Monitoring wallet: {self.wallet_address}")
+        print(f"⏰ Check interval: {check_interval} seconds")
+        print("🎯 Catching ALL new token purchases - no misses!")
+        print("Press Ctrl+C to stop...")
+
+        connector = aiohttp.TCPConnector(limit=128, ttl_dns_cache=300,
+                                         enable_cleanup_closed=True)
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            self.session = session
+
+            # Polling starts at the configured cadence and adapts from there
+            self._backoff = float(check_interval)
+
+            if self.use_ws:
+                try:
+                    await self._monitor_via_websocket()
+                    return
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"WebSocket monitoring failed ({e}), falling back to polling")
+
+            while True:
+                try:
+                    # The until cursor keeps responses small, so a modest
+                    # limit covers any realistic burst between polls
+                    transactions = await self.get_recent_transactions(25)
+                    logger.debug("Found %d recent transactions", len(transactions))
+                    if transactions:
+                        self._last_seen_sig = transactions[0]['signature']
+
+                    new_token_count = 0
+
+                    # Collect unprocessed recent signatures first, then fetch
+                    # all their details with a single batched POST
+                    new_signatures = []
+                    for tx in transactions:
+                        signature = tx['signature']
+
+                        # Skip if already processed
+                        if self._sig_key(signature) in self.processed_signatures:
+                            continue
+
+                        # Check if transaction is recent (within last 5 minutes)
+                        tx_time = tx.get('blockTime', 0)
+                        current_time = time.time()
+                        if current_time - tx_time > 300:  # 5 minutes
+                            logger.debug("Skipping old transaction: %s (age: %ds)", signature[:8], int(current_time - tx_time))
+                            continue
+
+                        logger.debug("Checking transaction: %s...", signature[:8])
+                        new_signatures.append(signature)
+
+                    tx_details_by_sig = await self.get_transactions_batch(new_signatures)
+
+                    for signature in new_signatures:
+                        tx_details = tx_details_by_sig.get(signature)
+
+                        if tx_details and self.is_new_token_created(tx_details):
+                            token_info = self.extract_new_token_info(tx_details)
+
+                            if token_info:
+                                new_token_count += 1
+                                logger.info(f"New token launch detected: {token_info['mint']}")
+                                print(f"🆕 NEW TOKEN LAUNCH DETECTED! (#{new_token_count})")
+
+                                # Metadata and age hit different endpoints;
+                                # overlap the two round-trips
+                                token_metadata, token_age = await asyncio.gather(
+                                    self.get_token_metadata(token_info['mint']),
+                                    self.get_token_age(token_info['mint'])
+                                )
+
+                                # Create and send alert
+                                alert_message = self.create_alert_message(
+                                    token_info, token_metadata, token_age, signature
+                                )
+
+                                await self.send_telegram_alert(alert_message)
+
+                        # Mark as processed
+                        self._mark_processed(signature)
+
+                    if new_token_count > 0:
+                        print(f"🎉 Found {new_token_count} new token purchases in this check!")
+                        # Activity: poll again quickly to catch the burst
+                        self._backoff = 1.0
+                    else:
+                        logger.debug("No new token purchases found in this check")
+                        # Idle: stretch the interval up to a 30s cap
+                        self._backoff = min(self._backoff * 1.5, 30.0)
+
+                    # Wait before next check
+                    await asyncio.sleep(self._backoff)
+
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error in monitoring loop: {e}")
+                    print(f"❌ Error: {e}")
+                    await asyncio.sleep(check_interval)
 
 def main():
     """Main function to run the wallet monitor"""
@@ -363,19 +559,22 @@ def main():
     TELEGRAM_CHAT_ID = "6251161332"
     RPC_URL = "https://api.mainnet-beta.solana.com"
     CHECK_INTERVAL = 10  # Check every 10 seconds
-    
+
     # Validate wallet address
     if len(WALLET_ADDRESS) < 32:
         print(f"❌ Invalid wallet address format. Expected at least 32 characters, got {len(WALLET_ADDRESS)}")
         return
-    
+
     print(f"✅ Wallet address is valid: {WALLET_ADDRESS}")
-    
+
     # Create and start monitor
     monitor = SolanaWalletMonitor(WALLET_ADDRESS, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, RPC_URL)
-    
+
     try:
-        monitor.monitor_wallet(CHECK_INTERVAL)
+        asyncio.run(monitor.monitor_wallet(CHECK_INTERVAL))
+    except KeyboardInterrupt:
+        logger.info("Monitoring stopped by user")
+        print("\n🛑 Monitoring stopped by user")
     except Exception as e:
         print(f"❌ Error: {e}")
 
@@ -384,6 +583,6 @@ if __name__ == "__main__":
     print("=" * 50)
     print("Monitoring for NEW TOKEN LAUNCHES!")
     print("=" * 50)
-    
+
     # Run the bot
-    main()
\ No newline at end of file
+    main()
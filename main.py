@@ -1,8 +1,11 @@
 import os
 import json
 import sqlite3
-import requests
-from flask import Flask, request
+import cachetools
+import httpx
+from pybloom_live import BloomFilter
+import uvicorn
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
 from datetime import datetime
 
 # === CONFIG ===
@@ -11,42 +14,56 @@ TELEGRAM_CHAT_ID = "6251161332"
 TARGET_WALLET = "gasTzr94Pmp4Gf8vknQnqxeYxdgwFjbgdJa4msYRpnB"
 HELIUS_API_KEY = "aae17b37-6805-43cd-8f67-921c96ce5c54"
 
-# Flask App
-app = Flask(__name__)
+# FastAPI App
+app = FastAPI()
+
+# Shared pooled async client so Telegram and Helius calls reuse connections
+CLIENT = httpx.AsyncClient(timeout=10.0)
+
+# Age lookups repeat for mints that keep appearing in webhooks; cache them
+# briefly to skip the Helius round-trip
+AGE_CACHE = cachetools.TTLCache(maxsize=1024, ttl=60)
 
 # === SQLite Setup ===
 DB_FILE = "tokens.db"
 
+# One long-lived connection instead of connect/close per lookup; WAL lets
+# reads proceed alongside writes and NORMAL sync skips an fsync per commit
+DB = sqlite3.connect(DB_FILE, check_same_thread=False, isolation_level=None)
+DB.execute("PRAGMA journal_mode=WAL")
+DB.execute("PRAGMA synchronous=NORMAL")
+
 def init_db():
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    c.execute("""
+    DB.execute("""
         CREATE TABLE IF NOT EXISTS detected_tokens (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             mint TEXT UNIQUE,
             detected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     """)
-    conn.commit()
-    conn.close()
+
+# Bloom filter in front of the SELECT: a miss proves the mint is new
+# without touching SQLite; only probable hits pay the query to rule out
+# false positives
+BLOOM = BloomFilter(capacity=1_000_000, error_rate=0.001)
 
 def token_exists(mint):
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    c.execute("SELECT 1 FROM detected_tokens WHERE mint=?", (mint,))
-    exists = c.fetchone() is not None
-    conn.close()
-    return exists
-
-def save_token(mint):
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    c.execute("INSERT OR IGNORE INTO detected_tokens (mint) VALUES (?)", (mint,))
-    conn.commit()
-    conn.close()
+    if mint not in BLOOM:
+        return False
+    return DB.execute("SELECT 1 FROM detected_tokens WHERE mint=?", (mint,)).fetchone() is not None
+
+def save_tokens(mints):
+    DB.executemany("INSERT OR IGNORE INTO detected_tokens (mint) VALUES (?)",
+                   [(m,) for m in mints])
+    for m in mints:
+        BLOOM.add(m)
+
+init_db()
+for (m,) in DB.execute("SELECT mint FROM detected_tokens"):
+    BLOOM.add(m)
 
 # === Telegram Alert ===
-def send_telegram_alert(token_name, token_symbol, mint, amount, signature, token_age):
+async def send_telegram_alert(token_name, token_symbol, mint, amount, signature, token_age):
     message = f"""
 🚨 New Token Buy Detected! 🚨
 
@@ -58,20 +75,24 @@ def send_telegram_alert(token_name, token_symbol, mint, amount, signature, token
 🔗 Tx: https://solscan.io/tx/{signature}
 """
     url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-    requests.post(url, data={"chat_id": TELEGRAM_CHAT_ID, "text": message})
+    await CLIENT.post(url, data={"chat_id": TELEGRAM_CHAT_ID, "text": message})
 
 
 # === Token Metadata (Helius) ===
-def get_token_age(mint):
+async def get_token_age(mint):
+    cached = AGE_CACHE.get(mint)
+    if cached is not None:
+        return cached
     try:
         url = f"https://api.helius.xyz/v0/token-metadata?api-key={HELIUS_API_KEY}"
         payload = {"mintAccounts": [mint]}
-        res = requests.post(url, json=payload).json()
+        res = (await CLIENT.post(url, json=payload)).json()
 
         if res and "onChainMetadata" in res[0]:
             created_at = res[0]["onChainMetadata"]["creationTime"]
             now = datetime.utcnow().timestamp()
             age_minutes = int((now - created_at) / 60)
+            AGE_CACHE[mint] = age_minutes
             return age_minutes
     except Exception as e:
         print("Error getting token age:", e)
@@ -79,16 +100,28 @@ def get_token_age(mint):
     return "Unknown"
 
 
+async def handle_alert(token_name, token_symbol, mint, amount, signature):
+    """Slow path (Helius + Telegram round-trips), run after the response"""
+    token_age = await get_token_age(mint)
+    await send_telegram_alert(token_name, token_symbol, mint, amount, signature, token_age)
+
+
 # === Webhook Route ===
-@app.route("/webhook", methods=["POST"])
-def webhook():
-    data = request.json
+@app.post("/webhook")
+async def webhook(request: Request, background_tasks: BackgroundTasks):
+    # Keep the Flask handler's error semantics: empty or malformed bodies
+    # answer 400 so Helius doesn't record a rejected delivery as success
+    try:
+        data = await request.json()
+    except Exception:
+        raise HTTPException(status_code=400, detail="invalid JSON")
     if not data:
-        return {"status": "no data"}, 400
+        raise HTTPException(status_code=400, detail="no data")
 
     signature = data.get("signature")
     token_transfers = data.get("tokenTransfers", [])
 
+    new_mints = []
     for t in token_transfers:
         to_wallet = t.get("toUserAccount")
         mint = t.get("mint")
@@ -96,15 +129,21 @@ def webhook():
         token_symbol = t.get("tokenSymbol", "???")
         amount = t.get("amount")
 
-        # Detect if it's first-time token buy
-        if to_wallet == TARGET_WALLET and not token_exists(mint):
-            save_token(mint)  # Save in DB
-            token_age = get_token_age(mint)
-            send_telegram_alert(token_name, token_symbol, mint, amount, signature, token_age)
+        # Detect if it's first-time token buy; the DB write is sub-ms, so it
+        # happens inline, while the network round-trips are deferred so the
+        # webhook answers before Helius starts retrying
+        if to_wallet == TARGET_WALLET and mint not in new_mints and not token_exists(mint):
+            new_mints.append(mint)
+            background_tasks.add_task(
+                handle_alert, token_name, token_symbol, mint, amount, signature
+            )
 
-    return {"status": "ok"}, 200
+    if new_mints:
+        # One batched insert for every new mint in this webhook
+        save_tokens(new_mints)
 
+    return {"status": "ok"}
 
-if __name__ == "__main__":
-    app.run(port=5000, use_reloader=False)
 
+if __name__ == "__main__":
+    uvicorn.run(app, port=5000)
@@ -1,8 +1,13 @@
+import httpx
 import asyncio
-import json
+import functools
+import orjson
+import sys
 import time
-import requests
 import base64
+from pybloom_live import BloomFilter
+from solders.pubkey import Pubkey
+import websockets
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 import logging
@@ -11,223 +16,455 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# orjson emits bytes, so the client cannot infer the content type
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Metaplex Token Metadata program; every mint's metadata lives in a PDA
+# derived from it, fetchable from the RPC we already talk to
+METADATA_PROGRAM_ID = Pubkey.from_string("metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s")
+
+# Interned program names: CPython compares interned strings by pointer
+# first, skipping the character walk on the hot per-instruction checks
+_SPL_TOKEN = sys.intern("spl-token")
+_ATA = sys.intern("spl-associated-token-account")
+
+# Instruction types that create/initialize token accounts; frozensets give
+# O(1) hashed membership instead of rebuilding a list literal per instruction
+_SPL_TOKEN_CREATE = frozenset({
+    "createAccount",
+    "createTokenAccount",
+    "initializeAccount",
+    "initializeAccount3",
+})
+_ATA_CREATE = frozenset({"create", "createIdempotent"})
+
+# Fixed-shape RPC bodies pre-serialized as bytes: only the signature (or
+# limit) is spliced in per call, skipping the dict build and JSON encode.
+# Base58 signatures never need JSON escaping, so %b splicing is safe
+_GETTX_TEMPLATE = (
+    b'{"jsonrpc":"2.0","id":1,"method":"getTransaction",'
+    b'"params":["%b",{"encoding":"jsonParsed",'
+    b'"maxSupportedTransactionVersion":0,"commitment":"confirmed"}]}'
+)
+
+# Alert template compiled once; format_map fills the per-alert fields
+# without re-parsing the format string on every launch
+_ALERT_TEMPLATE = """🚨 *NEW TOKEN LAUNCH DETECTED!* 🚨
+
+✅ *Token Name:* {name} ({symbol})
+✅ *Mint Address:* `{mint}`
+✅ *Amount:* {amount} {symbol}
+✅ *Token Age:* {age}
+✅ *TX Link:* https://solscan.io/tx/{signature}
+
+*Wallet:* `{wallet}`
+*Time:* {time}"""
+
+# Precomputed powers of ten for amount scaling (token decimals are <= 18)
+_POW10 = tuple(10 ** i for i in range(20))
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_amount(amount: str, decimals: int) -> str:
+    """Format a raw token amount; exact integer math, no float rounding"""
+    quotient, remainder = divmod(int(amount), _POW10[decimals])
+    if remainder == 0:
+        return f"{quotient:,}"
+    return f"{quotient:,}.{remainder:0{decimals}d}".rstrip('0').rstrip('.')
+
 class NewLaunchMonitor:
     def __init__(self, wallet_address: str, bot_token: str, chat_id: str, rpc_url: str = "https://api.mainnet-beta.solana.com"):
-        self.wallet_address = wallet_address
+        # Interned so the many owner comparisons short-circuit on identity
+        self.wallet_address = sys.intern(wallet_address)
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.rpc_url = rpc_url
-        self.processed_signatures = set()
-        
-    def get_recent_transactions(self, limit: int = 50) -> List[Dict]:
+        # Paired rotating Bloom filters: ~10 bits per signature instead of a
+        # set entry per 88-char string. When the active filter fills, it
+        # rotates into the inactive slot, so membership always covers the
+        # last one-to-two windows — far longer than the 3-minute recency
+        # window needs
+        self._bloom_capacity = 65536
+        self._bloom_active = BloomFilter(capacity=self._bloom_capacity, error_rate=1e-6)
+        self._bloom_inactive = BloomFilter(capacity=self._bloom_capacity, error_rate=1e-6)
+        self._bloom_count = 0
+        # One pooled HTTP/2 client for RPC, metadata APIs and Telegram:
+        # keep-alive amortizes the TCP+TLS handshake across calls, and
+        # multiplexing lets concurrent RPC requests share one TLS session
+        # without head-of-line blocking
+        self.session: Optional[httpx.AsyncClient] = None
+        # Cap in-flight RPC calls to stay within the public endpoint's
+        # rate limit
+        self._rpc_semaphore = asyncio.Semaphore(8)
+        # Per-mint caches: metadata entries carry a fetch timestamp — real
+        # results live an hour, Unknown fallbacks only briefly so failed
+        # lookups are retried without hammering; creation times are
+        # immutable so they never expire
+        self._metadata_cache: Dict[str, tuple] = {}
+        self._creation_time_cache: Dict[str, int] = {}
+        # Keep strong references to fire-and-forget send tasks so the event
+        # loop can't garbage-collect them mid-flight
+        self._pending_tasks: set = set()
+        # Push transport: logsSubscribe fires only when the wallet is
+        # mentioned, so idle intervals cost nothing; polling stays as the
+        # fallback when the endpoint has no WS support
+        self.use_ws = True
+        # Wallet never changes per instance; bake it into the template
+        self._alert_template = _ALERT_TEMPLATE.replace('{wallet}', wallet_address)
+        # Signature-listing body with the wallet baked in; %d takes the limit
+        self._sigs_template = (
+            '{"jsonrpc":"2.0","id":1,"method":"getSignaturesForAddress",'
+            '"params":["%s",{"limit":%%d}]}' % wallet_address
+        ).encode()
+        self.ws_url = rpc_url.replace("https://", "wss://").replace("http://", "ws://")
+
+    def _is_processed(self, signature: str) -> bool:
+        """Check the rotating filter pair for a signature"""
+        return signature in self._bloom_active or signature in self._bloom_inactive
+
+    def _mark_processed(self, signature: str):
+        """Record a signature, rotating filters once the active one fills"""
+        if self._bloom_count >= self._bloom_capacity:
+            self._bloom_inactive = self._bloom_active
+            self._bloom_active = BloomFilter(capacity=self._bloom_capacity, error_rate=1e-6)
+            self._bloom_count = 0
+        self._bloom_active.add(signature)
+        self._bloom_count += 1
+
+    async def get_recent_transactions(self, limit: int = 50) -> List[Dict]:
         """Get recent transactions for the monitored wallet using RPC"""
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getSignaturesForAddress",
-                "params": [
-                    self.wallet_address,
-                    {"limit": limit}
-                ]
-            }
-            
-            response = requests.post(self.rpc_url, json=payload, timeout=10)
+            response = await self.session.post(self.rpc_url,
+                                               content=self._sigs_template % limit,
+                                               headers=_JSON_HEADERS)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if 'result' in data:
                     return data['result']
             return []
         except Exception as e:
             logger.error(f"Error fetching transactions: {e}")
             return []
-    
-    def get_transaction_details(self, signature: str) -> Optional[Dict]:
+
+    async def get_transaction_details(self, signature: str) -> Optional[Dict]:
         """Get detailed transaction information using RPC with jsonParsed encoding"""
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getTransaction",
-                "params": [
-                    signature,
-                    {
-                        "encoding": "jsonParsed",
-                        "maxSupportedTransactionVersion": 0,
-                        "commitment": "confirmed"
-                    }
-                ]
-            }
-            
-            response = requests.post(self.rpc_url, json=payload, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if 'result' in data:
-                    return data['result']
+            async with self._rpc_semaphore:
+                response = await self.session.post(self.rpc_url,
+                                                   content=_GETTX_TEMPLATE % signature.encode(),
+                                                   headers=_JSON_HEADERS)
+                if response.status_code == 200:
+                    data = orjson.loads(response.content)
+                    if 'result' in data:
+                        return data['result']
             return None
         except Exception as e:
             logger.error(f"Error fetching transaction details for {signature}: {e}")
             return None
-    
-    def is_new_token_launch(self, transaction: Dict) -> bool:
-        """Check if transaction creates a new token account (new token launch)"""
+
+    async def get_transaction_details_batch(self, signatures: List[str]) -> Dict[str, Optional[Dict]]:
+        """Fetch many transactions in one JSON-RPC batch request.
+
+        Returns a dict keyed by signature; entries the server could not
+        resolve are None.
+        """
+        if not signatures:
+            return {}
         try:
-            if not transaction or 'transaction' not in transaction:
-                return False
-                
-            transaction_data = transaction['transaction']
-            message = transaction_data.get('message', {})
-            instructions = message.get('instructions', [])
-            
-            print(f"🔍 Analyzing transaction with {len(instructions)} instructions")
-            
-            # Check main instructions for token account creation
-            for i, instruction in enumerate(instructions):
-                program_id = instruction.get('program', '')
-                parsed = instruction.get('parsed', {})
-                instruction_type = parsed.get('type', '')
-                
-                print(f"📋 Instruction {i}: Program = {program_id}, Type = {instruction_type}")
-                
-                # Check for token account creation instructions
-                if program_id == "spl-token" and instruction_type in [
-                    "createAccount", 
-                    "createTokenAccount", 
-                    "initializeAccount",
-                    "initializeAccount3"
-                ]:
-                    print(f"✅ Found token account creation: {instruction_type}")
-                    return True
-                
-                # Check for associated token account creation
-                if program_id == "spl-associated-token-account" and instruction_type in [
-                    "create",
-                    "createIdempotent"
-                ]:
-                    print(f"✅ Found associated token account creation: {instruction_type}")
-                    return True
-            
-            # Check inner instructions for token account creation
-            meta = transaction.get('meta', {})
-            inner_instructions = meta.get('innerInstructions', [])
-            
-            for inner_group in inner_instructions:
-                for inner_instruction in inner_group.get('instructions', []):
-                    program_id = inner_instruction.get('program', '')
-                    parsed = inner_instruction.get('parsed', {})
-                    instruction_type = parsed.get('type', '')
-                    
-                    print(f"📋 Inner Instruction: Program = {program_id}, Type = {instruction_type}")
-                    
-                    if program_id == "spl-token" and instruction_type in [
-                        "createAccount", 
-                        "createTokenAccount", 
-                        "initializeAccount",
-                        "initializeAccount3"
-                    ]:
-                        print(f"✅ Found inner token account creation: {instruction_type}")
-                        return True
-                    
-                    if program_id == "spl-associated-token-account" and instruction_type in [
-                        "create",
-                        "createIdempotent"
-                    ]:
-                        print(f"✅ Found inner associated token account creation: {instruction_type}")
-                        return True
-            
-            return False
+            # JSON-RPC 2.0 batching: one HTTP POST carries an array of
+            # request objects, matched back by id
+            payload = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "getTransaction",
+                    "params": [
+                        sig,
+                        {
+                            "encoding": "jsonParsed",
+                            "maxSupportedTransactionVersion": 0,
+                            "commitment": "confirmed"
+                        }
+                    ]
+                }
+                for i, sig in enumerate(signatures)
+            ]
+
+            response = await self.session.post(self.rpc_url, content=orjson.dumps(payload),
+                                               headers=_JSON_HEADERS)
+            if response.status_code != 200:
+                return {sig: None for sig in signatures}
+            data = orjson.loads(response.content)
+
+            results: Dict[str, Optional[Dict]] = {sig: None for sig in signatures}
+            for item in data:
+                # Responses may arrive reordered; id is the input index
+                idx = item.get('id')
+                if isinstance(idx, int) and 0 <= idx < len(signatures):
+                    results[signatures[idx]] = item.get('result')
+            return results
         except Exception as e:
-            logger.error(f"Error checking if transaction creates new token: {e}")
+            logger.error(f"Error fetching transaction batch: {e}")
+            return {sig: None for sig in signatures}
+
+    def _creates_for_wallet(self, instruction: Dict) -> bool:
+        """True if this instruction creates a token account for our wallet"""
+        program_id = instruction.get('program', '')
+        parsed = instruction.get('parsed', {})
+        instruction_type = parsed.get('type', '')
+        if program_id == _SPL_TOKEN and instruction_type in _SPL_TOKEN_CREATE:
+            pass
+        elif program_id == _ATA and instruction_type in _ATA_CREATE:
+            pass
+        else:
+            return False
+        # Routed swaps create token accounts for other parties too; only a
+        # creation owned by the monitored wallet is a launch worth the
+        # metadata/age round-trips downstream
+        info = parsed.get('info', {})
+        owner = info.get('owner') or info.get('wallet') or info.get('account')
+        if owner != self.wallet_address:
+            logger.debug("Skipping %s create owned by %s", instruction_type, owner)
             return False
-    
-    def extract_new_token_info(self, transaction: Dict) -> Optional[Dict]:
-        """Extract new token information from transaction using balance analysis"""
+        logger.debug("Found token account creation for wallet: %s", instruction_type)
+        return True
+
+    def _has_create_instruction(self, transaction: Dict) -> bool:
+        """Single walk over main + inner instructions, early-returning on a create"""
+        message = transaction['transaction'].get('message', {})
+        for instruction in message.get('instructions', []):
+            if self._creates_for_wallet(instruction):
+                return True
+
+        for inner_group in transaction.get('meta', {}).get('innerInstructions', []):
+            for inner_instruction in inner_group.get('instructions', []):
+                if self._creates_for_wallet(inner_instruction):
+                    return True
+        return False
+
+    @staticmethod
+    def _token_info_from_balance(balance: Dict) -> Dict:
+        ui_token_amount = balance.get('uiTokenAmount') or {}
+        return {
+            'mint': balance['mint'],
+            'amount': ui_token_amount.get('amount', '0'),
+            'decimals': ui_token_amount.get('decimals', 0),
+            'ui_amount': ui_token_amount.get('uiAmount'),
+        }
+
+    def analyze_launch(self, transaction: Dict) -> Optional[Dict]:
+        """Detect a token launch and extract its token info in one pass.
+
+        Fuses the old is_new_token_launch / extract_new_token_info pair so
+        each candidate transaction is traversed once; returns the new
+        token's info dict, or None.
+        """
         try:
-            if not transaction or 'meta' not in transaction:
+            if not transaction or 'transaction' not in transaction or 'meta' not in transaction:
                 return None
-                
+
+            if not self._has_create_instruction(transaction):
+                return None
+
+            # A create was found; diff the balances from the meta we
+            # already hold to identify the freshly received mint
             meta = transaction['meta']
-            pre_token_balances = meta.get('preTokenBalances', [])
+            existing_mints = {balance['mint'] for balance in meta.get('preTokenBalances', [])}
             post_token_balances = meta.get('postTokenBalances', [])
-            
-            print(f"📊 Pre token balances: {len(pre_token_balances)}")
-            print(f"📊 Post token balances: {len(post_token_balances)}")
-            
-            # Find new token balances (tokens that weren't there before)
-            existing_mints = {balance['mint'] for balance in pre_token_balances}
-            
-            for balance in post_token_balances:
-                mint = balance['mint']
-                ui_amount = balance.get('uiTokenAmount', {}).get('uiAmount', 0)
-                
-                print(f"🔍 Checking mint {mint}: uiAmount = {ui_amount}")
-                
-                # If mint wasn't in pre-balances and has positive amount
-                if mint not in existing_mints and ui_amount is not None and ui_amount > 0:
-                    print(f"🎯 NEW TOKEN LAUNCH FOUND: {mint}")
-                    return {
-                        'mint': mint,
-                        'amount': balance.get('uiTokenAmount', {}).get('amount', '0'),
-                        'decimals': balance.get('uiTokenAmount', {}).get('decimals', 0),
-                        'ui_amount': ui_amount
-                    }
-            
-            # Fallback: If no new token found but we detected token account creation,
-            # return the first token with positive balance
-            print("🔍 No new token found in balance analysis, trying fallback...")
-            for balance in post_token_balances:
-                mint = balance['mint']
-                ui_amount = balance.get('uiTokenAmount', {}).get('uiAmount', 0)
-                
-                if ui_amount is not None and ui_amount > 0:
-                    print(f"🎯 FALLBACK: Using token {mint} with amount {ui_amount}")
-                    return {
-                        'mint': mint,
-                        'amount': balance.get('uiTokenAmount', {}).get('amount', '0'),
-                        'decimals': balance.get('uiTokenAmount', {}).get('decimals', 0),
-                        'ui_amount': ui_amount
-                    }
-            
+
+            hit = next(
+                (b for b in post_token_balances
+                 if b['mint'] not in existing_mints
+                 and b.get('owner') == self.wallet_address
+                 and ((b.get('uiTokenAmount') or {}).get('uiAmount') or 0) > 0),
+                None
+            )
+            if hit is not None:
+                logger.info("New token launch found: %s", hit['mint'])
+                return self._token_info_from_balance(hit)
+
+            # Fallback: a create happened but no strictly-new mint showed
+            # up; use the first positive post-balance
+            logger.debug("No new token found in balance analysis, trying fallback")
+            hit = next(
+                (b for b in post_token_balances
+                 if b.get('owner') == self.wallet_address
+                 and ((b.get('uiTokenAmount') or {}).get('uiAmount') or 0) > 0),
+                None
+            )
+            if hit is not None:
+                logger.info("Fallback: using token %s", hit['mint'])
+                return self._token_info_from_balance(hit)
+            return None
+        except Exception as e:
+            logger.error(f"Error analyzing transaction for token launch: {e}")
             return None
-            
+
+    @staticmethod
+    def _metadata_pda(mint_address: str) -> str:
+        """Derive the Metaplex metadata PDA for a mint"""
+        pda, _bump = Pubkey.find_program_address(
+            [b"metadata", bytes(METADATA_PROGRAM_ID), bytes(Pubkey.from_string(mint_address))],
+            METADATA_PROGRAM_ID
+        )
+        return str(pda)
+
+    async def _get_metaplex_metadata(self, mint_address: str) -> Optional[Dict]:
+        """Read name/symbol straight from the on-chain metadata account"""
+        try:
+            payload = {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "getAccountInfo",
+                "params": [
+                    self._metadata_pda(mint_address),
+                    {"encoding": "base64"}
+                ]
+            }
+            async with self._rpc_semaphore:
+                response = await self.session.post(self.rpc_url, content=orjson.dumps(payload),
+                                                   headers=_JSON_HEADERS)
+                if response.status_code != 200:
+                    return None
+                data = orjson.loads(response.content)
+
+            value = data.get('result', {}).get('value')
+            if not value:
+                return None
+            return self._parse_metadata_account(base64.b64decode(value['data'][0]))
         except Exception as e:
-            logger.error(f"Error extracting new token info: {e}")
+            logger.error(f"Error reading Metaplex metadata for {mint_address}: {e}")
+            return None
+
+    @staticmethod
+    def _parse_metadata_account(raw: bytes) -> Optional[Dict]:
+        """Decode name/symbol from a Metaplex metadata account's Borsh data"""
+        # Borsh layout: key (1) + update_authority (32) + mint (32),
+        # then length-prefixed name and symbol, null-padded
+        offset = 65
+        name_len = int.from_bytes(raw[offset:offset + 4], 'little')
+        offset += 4
+        name = raw[offset:offset + name_len].decode('utf-8', 'ignore').rstrip('\x00')
+        offset += name_len
+        symbol_len = int.from_bytes(raw[offset:offset + 4], 'little')
+        offset += 4
+        symbol = raw[offset:offset + symbol_len].decode('utf-8', 'ignore').rstrip('\x00')
+
+        if not name:
             return None
-    
-    def get_token_metadata(self, mint_address: str) -> Dict:
+        return {
+            'name': name,
+            'symbol': symbol or 'UNKNOWN',
+            'decimals': 9
+        }
+
+    async def get_token_metadata_batch(self, mint_addresses: List[str]) -> Dict[str, Dict]:
+        """Resolve metadata for several mints with one getMultipleAccounts.
+
+        All metadata PDAs go out in a single RPC call; mints whose
+        metadata account is missing fall back to the per-mint path
+        (Jupiter/Solscan) concurrently.
+        """
+        results: Dict[str, Dict] = {}
+        pending: List[str] = []
+        for mint in mint_addresses:
+            cached = self._metadata_cache.get(mint)
+            if cached:
+                fetched_at, metadata = cached
+                ttl = 3600 if metadata['name'] != 'Unknown Token' else 60
+                if time.time() - fetched_at < ttl:
+                    results[mint] = metadata
+                    continue
+            pending.append(mint)
+
+        if not pending:
+            return results
+
+        try:
+            payload = {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "getMultipleAccounts",
+                "params": [
+                    [self._metadata_pda(mint) for mint in pending],
+                    {"encoding": "base64"}
+                ]
+            }
+            async with self._rpc_semaphore:
+                response = await self.session.post(self.rpc_url, content=orjson.dumps(payload),
+                                                   headers=_JSON_HEADERS)
+                if response.status_code == 200:
+                    data = orjson.loads(response.content)
+                    accounts = data.get('result', {}).get('value') or []
+                    for mint, account in zip(pending, accounts):
+                        if not account:
+                            continue
+                        metadata = self._parse_metadata_account(
+                            base64.b64decode(account['data'][0]))
+                        if metadata is not None:
+                            self._metadata_cache[mint] = (time.time(), metadata)
+                            results[mint] = metadata
+        except Exception as e:
+            logger.error(f"Error fetching metadata batch: {e}")
+
+        missing = [mint for mint in pending if mint not in results]
+        if missing:
+            fallbacks = await asyncio.gather(
+                *(self.get_token_metadata(mint) for mint in missing))
+            results.update(zip(missing, fallbacks))
+        return results
+
+    async def get_token_metadata(self, mint_address: str) -> Dict:
         """Get token metadata from multiple sources"""
+        cached = self._metadata_cache.get(mint_address)
+        if cached:
+            fetched_at, metadata = cached
+            ttl = 3600 if metadata['name'] != 'Unknown Token' else 60
+            if time.time() - fetched_at < ttl:
+                return metadata
         try:
-            # Try Jupiter API first
+            # Try the Metaplex metadata PDA first: one small getAccountInfo
+            # against our own RPC, no third-party API in the alert path
+            metadata = await self._get_metaplex_metadata(mint_address)
+            if metadata is not None:
+                self._metadata_cache[mint_address] = (time.time(), metadata)
+                return metadata
+
+            # Try Jupiter API next
             jupiter_url = f"https://quote-api.jup.ag/v6/tokens/{mint_address}"
-            response = requests.get(jupiter_url, timeout=10)
-            
+            response = await self.session.get(jupiter_url)
             if response.status_code == 200:
-                data = response.json()
-                return {
+                data = orjson.loads(response.content)
+                metadata = {
                     'name': data.get('name', 'Unknown'),
                     'symbol': data.get('symbol', 'Unknown'),
                     'decimals': data.get('decimals', 9)
                 }
-            
+                self._metadata_cache[mint_address] = (time.time(), metadata)
+                return metadata
+
             # Try Solscan API
             solscan_url = f"https://public-api.solscan.io/token/meta?tokenAddress={mint_address}"
-            response = requests.get(solscan_url, timeout=10)
-            
+            response = await self.session.get(solscan_url)
             if response.status_code == 200:
-                data = response.json()
-                return {
+                data = orjson.loads(response.content)
+                metadata = {
                     'name': data.get('name', 'Unknown'),
                     'symbol': data.get('symbol', 'Unknown'),
                     'decimals': data.get('decimals', 9)
                 }
-            
-            # Fallback
-            return {
+                self._metadata_cache[mint_address] = (time.time(), metadata)
+                return metadata
+
+            # Fallback; cached briefly so failures are not re-fetched per hit
+            metadata = {
                 'name': 'Unknown Token',
                 'symbol': 'UNKNOWN',
                 'decimals': 9
             }
-            
+            self._metadata_cache[mint_address] = (time.time(), metadata)
+            return metadata
+
         except Exception as e:
             logger.error(f"Error fetching token metadata for {mint_address}: {e}")
             return {
@@ -235,73 +472,81 @@ class NewLaunchMonitor:
                 'symbol': 'UNKNOWN',
                 'decimals': 9
             }
-    
-    def get_token_age(self, mint_address: str) -> str:
+
+    async def get_token_age(self, mint_address: str, tx_block_time: Optional[int] = None) -> str:
         """Get token age by checking when it was first created"""
         try:
-            # Get signatures for the mint address
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getSignaturesForAddress",
-                "params": [
-                    mint_address,
-                    {"limit": 1000}
-                ]
-            }
-            
-            response = requests.post(self.rpc_url, json=payload, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if 'result' in data and data['result']:
-                    # Get the oldest signature (last in the list)
-                    oldest_tx = data['result'][-1]
-                    first_tx_time = oldest_tx.get('blockTime', 0)
-                    current_time = time.time()
-                    age_seconds = current_time - first_tx_time
-                    
-                    if age_seconds < 60:
-                        return f"{int(age_seconds)} seconds"
-                    elif age_seconds < 3600:
-                        return f"{int(age_seconds/60)} minutes"
-                    elif age_seconds < 86400:
-                        return f"{int(age_seconds/3600)} hours"
-                    else:
-                        return f"{int(age_seconds/86400)} days"
-            
+            # Cache the creation epoch, not the formatted string: age keeps
+            # moving but the creation time never does
+            first_tx_time = self._creation_time_cache.get(mint_address)
+            if first_tx_time is None and tx_block_time:
+                # The launch transaction we just analyzed carries its own
+                # blockTime — for a genuinely new token that is the creation
+                # time, no extra round-trip needed
+                first_tx_time = tx_block_time
+                self._creation_time_cache[mint_address] = first_tx_time
+            if first_tx_time is None:
+                # Get signatures for the mint address
+                payload = {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "getSignaturesForAddress",
+                    "params": [
+                        mint_address,
+                        {"limit": 1000}
+                    ]
+                }
+
+                async with self._rpc_semaphore:
+                    response = await self.session.post(self.rpc_url, content=orjson.dumps(payload),
+                                                       headers=_JSON_HEADERS)
+                    if response.status_code == 200:
+                        data = orjson.loads(response.content)
+                        if 'result' in data and data['result']:
+                            # Get the oldest signature (last in the list)
+                            oldest_tx = data['result'][-1]
+                            first_tx_time = oldest_tx.get('blockTime', 0)
+                            self._creation_time_cache[mint_address] = first_tx_time
+
+            if first_tx_time is not None:
+                age_seconds = time.time() - first_tx_time
+
+                if age_seconds < 60:
+                    return f"{int(age_seconds)} seconds"
+                elif age_seconds < 3600:
+                    return f"{int(age_seconds/60)} minutes"
+                elif age_seconds < 86400:
+                    return f"{int(age_seconds/3600)} hours"
+                else:
+                    return f"{int(age_seconds/86400)} days"
+
             return "Unknown"
-            
+
         except Exception as e:
             logger.error(f"Error getting token age for {mint_address}: {e}")
             return "Unknown"
-    
+
     def format_amount(self, amount: str, decimals: int) -> str:
         """Format token amount with proper decimal places"""
         try:
-            amount_int = int(amount)
-            formatted_amount = amount_int / (10 ** decimals)
-            return f"{formatted_amount:,.6f}".rstrip('0').rstrip('.')
-        except:
+            return _format_amount(amount, decimals)
+        except Exception:
             return amount
-    
+
     def create_alert_message(self, token_info: Dict, token_metadata: Dict, token_age: str, signature: str) -> str:
         """Create formatted alert message"""
-        amount = self.format_amount(token_info['amount'], token_info['decimals'])
-        
-        message = f"""🚨 *NEW TOKEN LAUNCH DETECTED!* 🚨
-
-✅ *Token Name:* {token_metadata['name']} ({token_metadata['symbol']})
-✅ *Mint Address:* `{token_info['mint']}`
-✅ *Amount:* {amount} {token_metadata['symbol']}
-✅ *Token Age:* {token_age}
-✅ *TX Link:* https://solscan.io/tx/{signature}
+        return self._alert_template.format_map({
+            'name': token_metadata['name'],
+            'symbol': token_metadata['symbol'],
+            'mint': token_info['mint'],
+            'amount': self.format_amount(token_info['amount'], token_info['decimals']),
+            'age': token_age,
+            'signature': signature,
+            'time': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        })
 
-*Wallet:* `{self.wallet_address}`
-*Time:* {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"""
-        return message.strip()
-    
-    def send_telegram_alert(self, message: str):
-        """Send alert to Telegram"""
+    async def send_telegram_alert(self, message: str):
+        """Send alert to Telegram, backing off on rate limits"""
         try:
             url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
             data = {
@@ -309,83 +554,182 @@ class NewLaunchMonitor:
                 "text": message,
                 "parse_mode": "Markdown"
             }
-            
-            response = requests.post(url, data=data, timeout=10)
-            if response.status_code == 200:
-                logger.info("✅ Telegram notification sent successfully")
-                print("✅ Alert sent to Telegram!")
-            else:
-                logger.error(f"❌ Failed to send Telegram notification: {response.status_code}")
-                print(f"❌ Failed to send to Telegram: {response.status_code}")
-                
+
+            backoff = 1.0
+            for _ in range(4):
+                response = await self.session.post(url, data=data)
+                if response.status_code == 200:
+                    logger.info("✅ Telegram notification sent successfully")
+                    return
+                if response.status_code != 429:
+                    break
+                # Rate limited; honor retry_after when Telegram provides it
+                retry_after = orjson.loads(response.content).get(
+                    'parameters', {}).get('retry_after', backoff)
+                await asyncio.sleep(retry_after)
+                backoff = min(backoff * 2, 30.0)
+            logger.error(f"❌ Failed to send Telegram notification: {response.status_code}")
+
         except Exception as e:
             logger.error(f"❌ Error sending Telegram notification: {e}")
-            print(f"❌ Error: {e}")
-    
-    def monitor_wallet(self, check_interval: int = 30):
+
+    def _send_telegram_nowait(self, message: str):
+        """Spawn the Telegram send so detection never waits on the round trip"""
+        task = asyncio.create_task(self.send_telegram_alert(message))
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+
+    async def _alert_launch(self, signature: str, tx_details: Dict, token_info: Dict,
+                            token_metadata: Optional[Dict] = None):
+        """Resolve metadata/age for a detected launch and send the alert"""
+        logger.info(f"New token launch detected: {token_info['mint']}")
+
+        if token_metadata is None:
+            # Metadata and age hit different endpoints; run them together
+            token_metadata, token_age = await asyncio.gather(
+                self.get_token_metadata(token_info['mint']),
+                self.get_token_age(token_info['mint'],
+                                   tx_details.get('blockTime'))
+            )
+        else:
+            token_age = await self.get_token_age(token_info['mint'],
+                                                 tx_details.get('blockTime'))
+
+        alert_message = self.create_alert_message(
+            token_info, token_metadata, token_age, signature
+        )
+
+        self._send_telegram_nowait(alert_message)
+
+    async def _process_sig(self, signature: str, tx_details: Optional[Dict]):
+        """Inspect one fetched transaction and alert if it launched a token"""
+        if tx_details:
+            token_info = self.analyze_launch(tx_details)
+            if token_info:
+                await self._alert_launch(signature, tx_details, token_info)
+
+    async def _monitor_via_websocket(self):
+        """Push-based monitoring over logsSubscribe; returns only on setup failure"""
+        # decoded so the subscribe goes out as a text frame, not binary
+        subscribe = orjson.dumps({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "logsSubscribe",
+            "params": [
+                {"mentions": [self.wallet_address]},
+                {"commitment": "confirmed"}
+            ]
+        }).decode()
+
+        # `async for` reconnects with backoff whenever the stream drops
+        async for ws in websockets.connect(self.ws_url, ping_interval=20):
+            try:
+                await ws.send(subscribe)
+                logger.info("Subscribed to logs mentioning %s", self.wallet_address)
+
+                async for raw in ws:
+                    msg = orjson.loads(raw)
+                    value = msg.get('params', {}).get('result', {}).get('value')
+                    if not value:
+                        continue
+                    if value.get('err') is not None:
+                        continue
+                    signature = value.get('signature')
+                    if not signature or self._is_processed(signature):
+                        continue
+                    self._mark_processed(signature)
+
+                    logger.debug("WS notification for %s...", signature[:8])
+                    tx_details = await self.get_transaction_details(signature)
+                    await self._process_sig(signature, tx_details)
+            except websockets.ConnectionClosed:
+                logger.warning("WebSocket connection closed; reconnecting")
+                continue
+
+    async def monitor_wallet(self, check_interval: int = 30):
         """Main monitoring loop"""
         logger.info(f"Starting new token launch monitoring for: {self.wallet_address}")
         logger.info(f"Check interval: {check_interval} seconds")
         print(f"🔍 Monitoring for NEW TOKEN LAUNCHES: {self.wallet_address}")
         print(f"⏰ Check interval: {check_interval} seconds")
         print("Press Ctrl+C to stop...")
-        
-        while True:
-            try:
-                # Get recent transactions
-                transactions = self.get_recent_transactions(50)
-                print(f"📊 Found {len(transactions)} recent transactions")
-                
-                for tx in transactions:
-                    signature = tx['signature']
-                    
-                    # Skip if already processed
-                    if signature in self.processed_signatures:
-                        continue
-                    
-                    # Check if transaction is recent (within last 3 minutes)
-                    tx_time = tx.get('blockTime', 0)
-                    current_time = time.time()
-                    if current_time - tx_time > 180:  # 3 minutes
-                        continue
-                    
-                    print(f"🔍 Checking transaction: {signature[:8]}...")
-                    
-                    # Get detailed transaction info with jsonParsed encoding
-                    tx_details = self.get_transaction_details(signature)
-                    
-                    if tx_details and self.is_new_token_launch(tx_details):
-                        token_info = self.extract_new_token_info(tx_details)
-                        
+
+        limits = httpx.Limits(max_keepalive_connections=8, max_connections=32)
+        async with httpx.AsyncClient(http2=True, timeout=10.0, limits=limits) as client:
+            self.session = client
+
+            if self.use_ws:
+                try:
+                    await self._monitor_via_websocket()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"WebSocket monitoring failed, falling back to polling: {e}")
+                    self.use_ws = False
+
+            while True:
+                try:
+                    # Get recent transactions
+                    transactions = await self.get_recent_transactions(50)
+                    logger.debug("Found %d recent transactions", len(transactions))
+
+                    # Collect unprocessed recent signatures first, then fetch
+                    # all their details with a single batched POST
+                    new_signatures = []
+                    for tx in transactions:
+                        signature = tx['signature']
+
+                        # Skip if already processed
+                        if self._is_processed(signature):
+                            continue
+
+                        # Failed transactions can't have launched anything;
+                        # the signature listing already tells us, so drop
+                        # them before paying a getTransaction for the details
+                        if tx.get('err') is not None:
+                            continue
+
+                        # Check if transaction is recent (within last 3 minutes)
+                        tx_time = tx.get('blockTime', 0)
+                        current_time = time.time()
+                        if current_time - tx_time > 180:  # 3 minutes
+                            continue
+
+                        logger.debug("Checking transaction: %s...", signature[:8])
+                        new_signatures.append(signature)
+                        self._mark_processed(signature)
+
+                    tx_details_by_sig = await self.get_transaction_details_batch(new_signatures)
+
+                    # Analyze everything first so all detected mints can share
+                    # one getMultipleAccounts metadata call
+                    launches = []
+                    for sig in new_signatures:
+                        tx_details = tx_details_by_sig.get(sig)
+                        if not tx_details:
+                            continue
+                        token_info = self.analyze_launch(tx_details)
                         if token_info:
-                            logger.info(f"New token launch detected: {token_info['mint']}")
-                            print(f"🆕 NEW TOKEN LAUNCH DETECTED!")
-                            
-                            # Get token metadata and age
-                            token_metadata = self.get_token_metadata(token_info['mint'])
-                            token_age = self.get_token_age(token_info['mint'])
-                            
-                            # Create and send alert
-                            alert_message = self.create_alert_message(
-                                token_info, token_metadata, token_age, signature
-                            )
-                            
-                            self.send_telegram_alert(alert_message)
-                    
-                    # Mark as processed
-                    self.processed_signatures.add(signature)
-                
-                # Wait before next check
-                time.sleep(check_interval)
-                
-            except KeyboardInterrupt:
-                logger.info("Monitoring stopped by user")
-                print("\n🛑 Monitoring stopped by user")
-                break
-            except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}")
-                print(f"❌ Error: {e}")
-                time.sleep(check_interval)
+                            launches.append((sig, tx_details, token_info))
+
+                    if launches:
+                        metadata_by_mint = await self.get_token_metadata_batch(
+                            list({info['mint'] for _, _, info in launches}))
+                        # Alerts are independent; overlap their age and send work
+                        await asyncio.gather(
+                            *(self._alert_launch(sig, tx_details, info,
+                                                 metadata_by_mint.get(info['mint']))
+                              for sig, tx_details, info in launches)
+                        )
+
+                    # Wait before next check
+                    await asyncio.sleep(check_interval)
+
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error in monitoring loop: {e}")
+                    await asyncio.sleep(check_interval)
 
 def main():
     """Main function to run the wallet monitor"""
@@ -395,19 +739,22 @@ def main():
     TELEGRAM_CHAT_ID = "6251161332"
     RPC_URL = "https://api.mainnet-beta.solana.com"
     CHECK_INTERVAL = 15  # Check every 15 seconds
-    
+
     # Validate wallet address
     if len(WALLET_ADDRESS) < 32:
         print(f"❌ Invalid wallet address format. Expected at least 32 characters, got {len(WALLET_ADDRESS)}")
         return
-    
+
     print(f"✅ Wallet address is valid: {WALLET_ADDRESS}")
-    
+
     # Create and start monitor
     monitor = NewLaunchMonitor(WALLET_ADDRESS, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, RPC_URL)
-    
+
     try:
-        monitor.monitor_wallet(CHECK_INTERVAL)
+        asyncio.run(monitor.monitor_wallet(CHECK_INTERVAL))
+    except KeyboardInterrupt:
+        logger.info("Monitoring stopped by user")
+        print("\n🛑 Monitoring stopped by user")
     except Exception as e:
         print(f"❌ Error: {e}")
 
@@ -416,6 +763,6 @@ if __name__ == "__main__":
     print("=" * 50)
     print("Monitoring ONLY for NEW TOKEN LAUNCHES!")
     print("=" * 50)
-    
+
     # Run the bot
     main()
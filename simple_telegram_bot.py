@@ -1,33 +1,117 @@
 import asyncio
-import json
+import orjson
+import sys
+from collections import OrderedDict
 import time
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
-import requests
+import diskcache
+import httpx
 from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solana.rpc.websocket_api import connect as ws_connect
+from solders.rpc.config import RpcTransactionLogsFilterMentions
 from solders.pubkey import Pubkey as PublicKey
+from solders.signature import Signature
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Precomputed powers of ten for amount scaling (token decimals are <= 18)
+POW10 = tuple(10 ** i for i in range(20))
+
+# Retry policy for the external HTTP calls (Jupiter, Telegram): transient
+# network failures and upstream 5xx get three attempts with exponential
+# backoff, anything else propagates immediately
+_RETRY_HTTP = dict(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.5, max=5),
+    retry=retry_if_exception_type((httpx.TransportError, httpx.HTTPStatusError)),
+    reraise=True,
+)
+
 class SolanaWalletMonitor:
+    # Compiled once; format_map fills the per-alert fields without
+    # re-parsing the format string every time
+    ALERT_TMPL = """🚨 *NEW TOKEN PURCHASE DETECTED!* 🚨
+
+✅ *Token Name:* {name} ({symbol})
+✅ *Mint Address:* `{mint}`
+✅ *Amount:* {amount} {symbol}
+✅ *Token Age:* {age}
+✅ *TX Link:* https://solscan.io/tx/{signature}
+
+*Wallet:* `{wallet}`
+*Time:* {time}"""
+
     def __init__(self, wallet_address: str, bot_token: str, chat_id: str, rpc_url: str = "https://api.mainnet-beta.solana.com"):
         self.wallet_address = wallet_address
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.rpc_client = AsyncClient(rpc_url, timeout=30)
+        self.rpc_url = rpc_url
         self.wallet_pubkey = PublicKey.from_string(wallet_address)
-        self.processed_signatures = set()
+        # Canonical forms derived once: the interned string feeds alerts and
+        # subscriptions, the raw bytes any binary comparison
+        self._wallet_str = sys.intern(str(self.wallet_pubkey))
+        self._wallet_bytes = bytes(self.wallet_pubkey)
+        # Pooled async client for Jupiter/Telegram: keep-alive reuses the
+        # TLS session across calls and the event loop keeps running while
+        # requests are in flight
+        self.http = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=10.0
+        )
+        # Bounded FIFO of seen signatures: a plain set grows for the life
+        # of the process; 5000 entries is ~100x one poll's worth
+        self.processed_signatures = OrderedDict()
+        # Newest signature seen so far; passed as `until` so each poll only
+        # returns what happened since the previous one
+        self.last_sig: Optional[str] = None
+        # Push transport: logsSubscribe fires only when the wallet is
+        # mentioned; polling remains as the fallback on WS failure
+        self.use_ws = True
+        self.ws_url = rpc_url.replace("https://", "wss://").replace("http://", "ws://")
+        # Name, symbol, decimals and creation time are immutable per mint;
+        # a disk cache survives restarts so known tokens never refetch
+        self.token_cache = diskcache.Cache('./tokencache')
+        # Alerts go through a bounded queue drained by one worker task, so
+        # detection never waits on a Telegram round trip
+        self._alert_queue: asyncio.Queue = asyncio.Queue(maxsize=100)
+        # In-flight metadata futures keyed by mint (single-flight dedup)
+        self._inflight: Dict[str, asyncio.Future] = {}
         
+    @retry(**_RETRY_HTTP)
+    async def _get(self, url: str) -> httpx.Response:
+        """GET with retries; 5xx responses raise so tenacity retries them"""
+        response = await self.http.get(url)
+        if response.status_code >= 500:
+            response.raise_for_status()
+        return response
+
+    @retry(**_RETRY_HTTP)
+    async def _post_form(self, url: str, data: Dict) -> httpx.Response:
+        """Form POST with retries; 5xx responses raise so tenacity retries them"""
+        response = await self.http.post(url, data=data)
+        if response.status_code >= 500:
+            response.raise_for_status()
+        return response
+
     async def get_recent_transactions(self, limit: int = 50) -> List[Dict]:
-        """Get recent transactions for the monitored wallet"""
+        """Get transactions newer than the last poll for the monitored wallet"""
         try:
             signatures = await self.rpc_client.get_signatures_for_address(
                 self.wallet_pubkey, 
+                until=Signature.from_string(self.last_sig) if self.last_sig else None,
                 limit=limit
             )
+            if signatures.value:
+                # Results are newest-first; remember the head for next poll
+                self.last_sig = str(signatures.value[0].signature)
             return signatures.value
         except Exception as e:
             logger.error(f"Error fetching transactions: {e}")
@@ -42,69 +126,122 @@ class SolanaWalletMonitor:
             logger.error(f"Error fetching transaction details for {signature}: {e}")
             return None
     
-    def is_token_purchase(self, transaction: Dict) -> bool:
-        """Check if transaction is a token purchase"""
+    async def get_transaction_details_batch(self, signatures: List[str]) -> Dict[str, Optional[Dict]]:
+        """Fetch many transactions in one JSON-RPC batch request.
+
+        Bypasses solana-py's per-call API: one HTTP POST carries an array
+        of request objects, matched back by id since the server may
+        reorder responses. Returns a dict keyed by signature; entries the
+        server could not resolve are None.
+        """
+        if not signatures:
+            return {}
         try:
-            if not transaction or 'meta' not in transaction:
-                return False
-                
-            meta = transaction['meta']
-            pre_balances = meta.get('preBalances', [])
-            post_balances = meta.get('postBalances', [])
-            
-            # Check if SOL balance decreased (indicating a purchase)
-            if len(pre_balances) > 0 and len(post_balances) > 0:
-                sol_decrease = pre_balances[0] - post_balances[0]
-                return sol_decrease > 0
-                
-            return False
+            payload = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "getTransaction",
+                    "params": [
+                        sig,
+                        {
+                            "encoding": "json",
+                            "commitment": "confirmed",
+                            "maxSupportedTransactionVersion": 0
+                        }
+                    ]
+                }
+                for i, sig in enumerate(signatures)
+            ]
+
+            response = await self.http.post(
+                self.rpc_url,
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"}
+            )
+            if response.status_code != 200:
+                return {sig: None for sig in signatures}
+
+            results: Dict[str, Optional[Dict]] = {sig: None for sig in signatures}
+            for item in orjson.loads(response.content):
+                idx = item.get('id')
+                if isinstance(idx, int) and 0 <= idx < len(signatures):
+                    results[signatures[idx]] = item.get('result')
+            return results
         except Exception as e:
-            logger.error(f"Error checking if transaction is token purchase: {e}")
-            return False
-    
-    def extract_token_info(self, transaction: Dict) -> Optional[Dict]:
-        """Extract token information from transaction"""
+            logger.error(f"Error fetching transaction batch: {e}")
+            return {sig: None for sig in signatures}
+
+    def parse_purchase(self, transaction: Dict) -> Optional[Dict]:
+        """Detect a token purchase and extract its token info in one pass.
+
+        Fuses the old is_token_purchase / extract_token_info pair so meta
+        is indexed once per transaction; returns the purchased token's
+        info dict, or None.
+        """
         try:
-            if not transaction or 'meta' not in transaction:
-                return None
-                
-            meta = transaction['meta']
-            pre_token_balances = meta.get('preTokenBalances', [])
-            post_token_balances = meta.get('postTokenBalances', [])
+            meta = (transaction or {}).get('meta') or {}
+            pre_balances = meta.get('preBalances') or []
+            post_balances = meta.get('postBalances') or []
             
-            # Find new token balances (tokens that weren't there before)
-            new_tokens = []
-            existing_mints = {balance['mint'] for balance in pre_token_balances}
-            
-            for balance in post_token_balances:
-                mint = balance['mint']
-                if mint not in existing_mints:
-                    new_tokens.append({
-                        'mint': mint,
-                        'amount': balance.get('uiTokenAmount', {}).get('amount', '0'),
-                        'decimals': balance.get('uiTokenAmount', {}).get('decimals', 0)
-                    })
+            # SOL balance must have decreased (indicating a purchase)
+            if not pre_balances or not post_balances or pre_balances[0] <= post_balances[0]:
+                return None
             
-            return new_tokens[0] if new_tokens else None
+            # First mint that wasn't there before; next() stops at the first
+            # hit instead of building a list of all of them
+            existing_mints = {balance['mint'] for balance in meta.get('preTokenBalances') or []}
             
+            return next(
+                ({
+                    'mint': balance['mint'],
+                    'amount': (balance.get('uiTokenAmount') or {}).get('amount', '0'),
+                    'decimals': (balance.get('uiTokenAmount') or {}).get('decimals', 0)
+                }
+                 for balance in meta.get('postTokenBalances') or []
+                 if balance['mint'] not in existing_mints),
+                None
+            )
         except Exception as e:
-            logger.error(f"Error extracting token info: {e}")
+            logger.error(f"Error parsing transaction for token purchase: {e}")
             return None
     
     async def get_token_metadata(self, mint_address: str) -> Dict:
+        """Get token metadata, coalescing concurrent lookups per mint.
+
+        Two purchases of the same new mint in one poll would otherwise
+        fire identical Jupiter requests; late arrivals await the future
+        already in flight instead.
+        """
+        fut = self._inflight.get(mint_address)
+        if fut is not None:
+            return await fut
+        fut = asyncio.ensure_future(self._fetch_token_metadata(mint_address))
+        self._inflight[mint_address] = fut
+        try:
+            return await fut
+        finally:
+            self._inflight.pop(mint_address, None)
+
+    async def _fetch_token_metadata(self, mint_address: str) -> Dict:
         """Get token metadata including name and creation date"""
+        cached = self.token_cache.get(('meta', mint_address))
+        if cached is not None:
+            return cached
         try:
             # Try to get token metadata from Jupiter API
             jupiter_url = f"https://quote-api.jup.ag/v6/tokens/{mint_address}"
-            response = requests.get(jupiter_url, timeout=10)
+            response = await self._get(jupiter_url)
             
             if response.status_code == 200:
-                data = response.json()
-                return {
+                data = orjson.loads(response.content)
+                metadata = {
                     'name': data.get('name', 'Unknown'),
                     'symbol': data.get('symbol', 'Unknown'),
                     'decimals': data.get('decimals', 9)
                 }
+                self.token_cache[('meta', mint_address)] = metadata
+                return metadata
             
             # Fallback to basic info
             return {
@@ -121,21 +258,28 @@ class SolanaWalletMonitor:
                 'decimals': 9
             }
     
-    async def get_token_age(self, mint_address: str) -> str:
+    async def get_token_age(self, mint_address: str, now: Optional[float] = None) -> str:
         """Get token age by checking when it was first created"""
         try:
-            # Get the first transaction for this mint address
-            mint_pubkey = PublicKey(mint_address)
-            signatures = await self.rpc_client.get_signatures_for_address(
-                mint_pubkey, 
-                limit=1
-            )
+            # The creation time is immutable, so it is what gets cached;
+            # the human-readable age is recomputed on every read
+            first_tx_time = self.token_cache.get(('created', mint_address))
+            if first_tx_time is None:
+                # Get the first transaction for this mint address
+                mint_pubkey = PublicKey.from_string(mint_address)
+                signatures = await self.rpc_client.get_signatures_for_address(
+                    mint_pubkey, 
+                    limit=1
+                )
+                
+                if signatures.value:
+                    # solders status objects expose block_time, not a dict
+                    first_tx_time = signatures.value[0].block_time
+                    if first_tx_time is not None:
+                        self.token_cache[('created', mint_address)] = first_tx_time
             
-            if signatures.value:
-                first_tx = signatures.value[0]
-                first_tx_time = first_tx.get('blockTime', 0)
-                current_time = time.time()
-                age_seconds = current_time - first_tx_time
+            if first_tx_time is not None:
+                age_seconds = (now if now is not None else time.time()) - first_tx_time
                 
                 if age_seconds < 60:
                     return f"{int(age_seconds)} seconds"
@@ -152,30 +296,43 @@ class SolanaWalletMonitor:
             logger.error(f"Error getting token age for {mint_address}: {e}")
             return "Unknown"
     
+    async def get_token_ages(self, mints: List[str]) -> List[str]:
+        """Resolve several mints' ages concurrently, capped at 10 in flight"""
+        sem = asyncio.Semaphore(10)
+        # One clock read shared by the whole batch; each call is a syscall
+        now = time.time()
+        
+        async def one(mint: str) -> str:
+            async with sem:
+                return await self.get_token_age(mint, now)
+        
+        return await asyncio.gather(*(one(mint) for mint in mints))
+
     def format_amount(self, amount: str, decimals: int) -> str:
         """Format token amount with proper decimal places"""
         try:
-            amount_int = int(amount)
-            formatted_amount = amount_int / (10 ** decimals)
-            return f"{formatted_amount:,.6f}".rstrip('0').rstrip('.')
-        except:
+            # Integer divmod keeps full precision; the float path rounds
+            # raw amounts above 2**53
+            quotient, remainder = divmod(int(amount), POW10[decimals])
+            if remainder == 0:
+                return f"{quotient:,}"
+            return f"{quotient:,}.{remainder:0{decimals}d}".rstrip('0').rstrip('.')
+        except Exception:
             return amount
     
     def create_alert_message(self, token_info: Dict, token_metadata: Dict, token_age: str, signature: str) -> str:
         """Create formatted alert message"""
-        amount = self.format_amount(token_info['amount'], token_info['decimals'])
-        
-        message = f"""🚨 *NEW TOKEN PURCHASE DETECTED!* 🚨
-
-✅ *Token Name:* {token_metadata['name']} ({token_metadata['symbol']})
-✅ *Mint Address:* `{token_info['mint']}`
-✅ *Amount:* {amount} {token_metadata['symbol']}
-✅ *Token Age:* {token_age}
-✅ *TX Link:* https://solscan.io/tx/{signature}
-
-*Wallet:* `{self.wallet_address}`
-*Time:* {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"""
-        return message.strip()
+        # isoformat is implemented in C and skips strftime's format parsing
+        return self.ALERT_TMPL.format_map({
+            'name': token_metadata['name'],
+            'symbol': token_metadata['symbol'],
+            'mint': token_info['mint'],
+            'amount': self.format_amount(token_info['amount'], token_info['decimals']),
+            'age': token_age,
+            'signature': signature,
+            'wallet': self._wallet_str,
+            'time': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        })
     
     async def send_telegram_alert(self, message: str):
         """Send alert to Telegram"""
@@ -187,7 +344,7 @@ class SolanaWalletMonitor:
                 "parse_mode": "Markdown"
             }
             
-            response = requests.post(url, data=data, timeout=10)
+            response = await self._post_form(url, data=data)
             if response.status_code == 200:
                 logger.info("✅ Telegram notification sent successfully")
                 print("✅ Alert sent to Telegram!")
@@ -199,6 +356,79 @@ class SolanaWalletMonitor:
             logger.error(f"❌ Error sending Telegram notification: {e}")
             print(f"❌ Error: {e}")
     
+    def _detect_purchase(self, signature: str, tx_details: Optional[Dict]) -> Optional[Dict]:
+        """Return the purchased token's info if this transaction is a buy"""
+        token_info = self.parse_purchase(tx_details)
+        if token_info:
+            logger.info(f"New token purchase detected: {token_info['mint']}")
+            print(f"🆕 New token purchase detected!")
+        return token_info
+
+    async def _process_transaction(self, signature: str, tx_details: Optional[Dict]):
+        """Inspect one fetched transaction and alert if it is a token purchase"""
+        token_info = self._detect_purchase(signature, tx_details)
+        if token_info:
+            token_metadata = await self.get_token_metadata(token_info['mint'])
+            # Jupiter only indexes tokens that are established and listed;
+            # a hit there means the token is old news and the exact age
+            # RPC can be skipped. Fresh launches still get the real age
+            if token_metadata['name'] != 'Unknown Token':
+                token_age = "over a day (listed)"
+            else:
+                token_age = await self.get_token_age(token_info['mint'])
+            
+            # Create and send alert
+            alert_message = self.create_alert_message(
+                token_info, token_metadata, token_age, signature
+            )
+            
+            self._queue_alert(alert_message)
+
+    async def _monitor_via_websocket(self):
+        """Push-based monitoring: the RPC notifies us instead of being polled"""
+        async with ws_connect(self.ws_url) as websocket:
+            await websocket.logs_subscribe(
+                RpcTransactionLogsFilterMentions(self.wallet_pubkey),
+                commitment=Confirmed
+            )
+            first_resp = await websocket.recv()
+            subscription_id = first_resp[0].result
+            logger.info(f"Subscribed to logs mentioning {self.wallet_address}")
+            
+            try:
+                async for messages in websocket:
+                    for msg in messages:
+                        value = msg.result.value
+                        if value.err is not None:
+                            continue
+                        signature = str(value.signature)
+                        if signature in self.processed_signatures:
+                            continue
+                        self.processed_signatures[signature] = None
+                        if len(self.processed_signatures) > 5000:
+                            self.processed_signatures.popitem(last=False)
+                        
+                        tx_details_by_sig = await self.get_transaction_details_batch([signature])
+                        await self._process_transaction(signature, tx_details_by_sig.get(signature))
+            finally:
+                await websocket.logs_unsubscribe(subscription_id)
+
+    def _queue_alert(self, message: str):
+        """Hand an alert to the worker; drop (and log) if the queue is full"""
+        try:
+            self._alert_queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.error("Alert queue full; dropping alert")
+
+    async def _alert_worker(self):
+        """Drain the alert queue, sending one Telegram message at a time"""
+        while True:
+            message = await self._alert_queue.get()
+            try:
+                await self.send_telegram_alert(message)
+            finally:
+                self._alert_queue.task_done()
+
     async def monitor_wallet(self, check_interval: int = 30):
         """Main monitoring loop"""
         logger.info(f"Starting wallet monitoring for: {self.wallet_address}")
@@ -207,50 +437,84 @@ class SolanaWalletMonitor:
         print(f"⏰ Check interval: {check_interval} seconds")
         print("Press Ctrl+C to stop...")
         
+        # Bind the worker task so the event loop keeps a strong reference
+        alert_worker = asyncio.create_task(self._alert_worker())
+        # Adaptive fallback polling: quiet wallets back the interval off to
+        # a cap, activity snaps it back down
+        interval = float(check_interval)
+        
+        if self.use_ws:
+            try:
+                await self._monitor_via_websocket()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"WebSocket monitoring failed, falling back to polling: {e}")
+                self.use_ws = False
+        
         while True:
             try:
                 # Get recent transactions
                 transactions = await self.get_recent_transactions(50)
                 
+                # Collect unprocessed recent signatures first, then fetch
+                # all their details with a single batched POST
+                new_signatures = []
                 for tx in transactions:
-                    signature = tx['signature']
+                    # solana-py returns solders status objects, not dicts
+                    signature = str(tx.signature)
                     
-                    # Skip if already processed
+                    # Skip if already processed; the `until` cursor already
+                    # limits results to this poll's window, so no blockTime
+                    # recency check is needed
                     if signature in self.processed_signatures:
                         continue
                     
-                    # Check if transaction is recent (within last 10 minutes)
-                    tx_time = tx.get('blockTime', 0)
-                    current_time = time.time()
-                    if current_time - tx_time > 600:  # 10 minutes
+                    # Failed transactions can't be purchases; the signature
+                    # listing already says so, no need to fetch the details
+                    if tx.err is not None:
                         continue
                     
-                    # Get detailed transaction info
-                    tx_details = await self.get_transaction_details(signature)
-                    
-                    if tx_details and self.is_token_purchase(tx_details):
-                        token_info = self.extract_token_info(tx_details)
-                        
-                        if token_info:
-                            logger.info(f"New token purchase detected: {token_info['mint']}")
-                            print(f"🆕 New token purchase detected!")
-                            
-                            # Get token metadata and age
-                            token_metadata = await self.get_token_metadata(token_info['mint'])
-                            token_age = await self.get_token_age(token_info['mint'])
-                            
-                            # Create and send alert
-                            alert_message = self.create_alert_message(
-                                token_info, token_metadata, token_age, signature
-                            )
-                            
-                            await self.send_telegram_alert(alert_message)
+                    new_signatures.append(signature)
+
+                tx_details_by_sig = await self.get_transaction_details_batch(new_signatures)
+
+                # Detect everything first so all the purchased mints' ages
+                # and metadata resolve in one concurrent dispatch
+                purchases = []
+                for signature in new_signatures:
+                    token_info = self._detect_purchase(signature, tx_details_by_sig.get(signature))
+                    if token_info:
+                        purchases.append((signature, token_info))
                     
-                    # Mark as processed
-                    self.processed_signatures.add(signature)
+                    # Mark as processed, evicting the oldest when full
+                    self.processed_signatures[signature] = None
+                    if len(self.processed_signatures) > 5000:
+                        self.processed_signatures.popitem(last=False)
                 
-                # Wait before next check
-                await asyncio.sleep(check_interval)
+                if purchases:
+                    mints = [token_info['mint'] for _, token_info in purchases]
+                    metadatas = await asyncio.gather(
+                        *(self.get_token_metadata(m) for m in mints))
+                    # Only unlisted tokens need the age RPC (see
+                    # _process_transaction); resolve those in one dispatch
+                    unknown = [m for m, meta in zip(mints, metadatas)
+                               if meta['name'] == 'Unknown Token']
+                    unknown_ages = dict(zip(unknown, await self.get_token_ages(unknown)))
+                    ages = [unknown_ages.get(m, "over a day (listed)") for m in mints]
+                    for (signature, token_info), token_metadata, token_age in zip(
+                            purchases, metadatas, ages):
+                        alert_message = self.create_alert_message(
+                            token_info, token_metadata, token_age, signature
+                        )
+                        self._queue_alert(alert_message)
+                
+                # Back off while idle, react quickly while active
+                if new_signatures:
+                    interval = 5.0
+                else:
+                    interval = min(interval * 2, 120.0)
+                await asyncio.sleep(interval)
                 
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
@@ -259,7 +523,9 @@ class SolanaWalletMonitor:
     
     async def close(self):
         """Close the RPC client"""
+        await self.http.aclose()
         await self.rpc_client.close()
+        self.token_cache.close()
 
 async def main():
     """Main function to run the wallet monitor"""
@@ -270,22 +536,14 @@ async def main():
     RPC_URL = "https://api.mainnet-beta.solana.com"
     CHECK_INTERVAL = 30  # Check every 30 seconds
     
-    # Validate wallet address
+    # The constructor's PublicKey.from_string is the real validation —
+    # base58 decode to exactly 32 bytes — so no separate check is needed
     try:
-        # Convert string to bytes for PublicKey validation
-        if len(WALLET_ADDRESS) >= 32:  # Base58 encoded address (32-44 chars)
-            from solders.pubkey import Pubkey
-            pubkey = Pubkey.from_string(WALLET_ADDRESS)
-            print(f"✅ Wallet address is valid: {WALLET_ADDRESS}")
-        else:
-            print(f"❌ Invalid wallet address format. Expected at least 32 characters, got {len(WALLET_ADDRESS)}")
-            return
+        monitor = SolanaWalletMonitor(WALLET_ADDRESS, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, RPC_URL)
     except Exception as e:
         print(f"❌ Invalid wallet address: {e}")
         return
-    
-    # Create and start monitor
-    monitor = SolanaWalletMonitor(WALLET_ADDRESS, TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, RPC_URL)
+    print(f"✅ Wallet address is valid: {WALLET_ADDRESS}")
     
     try:
         await monitor.monitor_wallet(CHECK_INTERVAL)
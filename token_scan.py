@@ -0,0 +1,97 @@
+"""Hot instruction scanner for new-token detection.
+
+Kept free of I/O and logging so it can be compiled with mypyc
+(`mypyc token_scan.py`); when the compiled extension is present it shadows
+this module on import and the scan runs at near-C speed, otherwise the
+plain-Python version below is used.
+"""
+import base64
+import functools
+from typing import Any, Dict, List, Optional
+
+TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+SYSTEM_PROGRAM_ID = "11111111111111111111111111111112"
+
+# The first base64 character carries the top six bits of byte 0, so it fully
+# determines whether the instruction discriminator can be 0 or 1
+# (InitializeAccount / InitializeAccount2): both need those bits to be zero,
+# i.e. a leading 'A'. Same idea for the System Program's little-endian
+# u32 == 0 (CreateAccount): the first two chars must be 'AA'.
+_TOKEN_INIT_B64_PREFIX = 'A'
+_SYS_CREATE_B64_PREFIX = 'AA'
+
+# 256-entry base64 value table: maps a character code to its 6-bit value,
+# 255 for characters outside the alphabet. The first payload byte is
+# (v0 << 2) | (v1 >> 4), so two lookups recover the instruction
+# discriminator with no b64decode call and no bytes allocation.
+_B64VAL = [255] * 256
+for _i, _c in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"):
+    _B64VAL[ord(_c)] = _i
+del _i, _c
+
+
+@functools.lru_cache(maxsize=256)
+def _b64(data: str) -> bytes:
+    """b64decode with memoization; short payloads repeat constantly"""
+    return base64.b64decode(data)
+
+
+def _first_data_byte(data: str) -> int:
+    """First decoded byte of a base64 string, or -1 if undecodable"""
+    if len(data) < 2:
+        return -1
+    v0 = _B64VAL[ord(data[0]) & 0xFF]
+    v1 = _B64VAL[ord(data[1]) & 0xFF]
+    if v0 == 255 or v1 == 255:
+        return -1
+    return (v0 << 2) | (v1 >> 4)
+
+
+_PROGRAMS = frozenset({TOKEN_PROGRAM_ID, SYSTEM_PROGRAM_ID})
+
+
+def _resolve_program_ids(instructions: List[Dict[str, Any]],
+                         account_keys: List[str]) -> List[Optional[str]]:
+    """Map each instruction to its program ID (None when out of range)"""
+    n_keys = len(account_keys)
+    ids: List[Optional[str]] = []
+    for instruction in instructions:
+        idx = instruction.get('programIdIndex', -1)
+        ids.append(account_keys[idx] if 0 <= idx < n_keys else None)
+    return ids
+
+
+def scan_instructions(instructions: List[Dict[str, Any]], account_keys: List[str]) -> bool:
+    """Return True if any instruction creates/initializes a token account"""
+    # Resolve program IDs once, then drive the scan over the parallel list —
+    # uninteresting programs are skipped before touching instruction data
+    program_ids = _resolve_program_ids(instructions, account_keys)
+    for program_id, instruction in zip(program_ids, instructions):
+        if program_id not in _PROGRAMS:
+            continue
+
+        if program_id == TOKEN_PROGRAM_ID:
+            # InitializeAccount (0) or InitializeAccount2 (1); the
+            # discriminator is just the first byte, recovered straight from
+            # the first two base64 characters — no decode at all
+            data = instruction.get('data', '')
+            if data and data[0] == _TOKEN_INIT_B64_PREFIX:
+                first_byte = _first_data_byte(data)
+                if first_byte == 0 or first_byte == 1:
+                    return True
+
+        elif program_id == SYSTEM_PROGRAM_ID:
+            # System Program CreateAccount instruction type is 0
+            data = instruction.get('data', '')
+            if data and data[:2] == _SYS_CREATE_B64_PREFIX:
+                try:
+                    # Short payloads (CreateAccount is 52 bytes, but many
+                    # System instructions are shorter and highly repetitive)
+                    # go through the memoized decoder
+                    decoded_data = _b64(data) if len(data) < 32 else base64.b64decode(data)
+                    if len(decoded_data) >= 4 and int.from_bytes(decoded_data[:4], 'little') == 0:
+                        return True
+                except Exception:
+                    pass
+
+    return False